@@ -6,80 +6,204 @@ Uses advanced NLP techniques to understand human intent
 """
 import os
 import re
+import errno
+import fnmatch
+import functools
 import shutil
+import zlib
 from pathlib import Path
 import subprocess
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional, Union
 import json
 
+try:
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    HAVE_AHOCORASICK = False
+
+try:
+    import hyperscan
+    HAVE_HYPERSCAN = True
+except ImportError:
+    HAVE_HYPERSCAN = False
+
+def _build_master_pattern(intent_patterns: Dict[str, List[str]]) -> Tuple[re.Pattern, Dict[int, Tuple[str, int]]]:
+    """Fuse every intent pattern into one alternation
+    
+    Each branch is `.*?(?P<intent__i>pattern)` and the whole thing is used
+    with `match`, so branches are tried in declaration order exactly like
+    searching pattern by pattern, but in a single regex call.
+    Returns the compiled regex and a map of branch group index -> (intent, capture count).
+    """
+    alternatives = []
+    branches = {}
+    group_index = 1
+    for intent, patterns in intent_patterns.items():
+        for i, pattern in enumerate(patterns):
+            capture_count = re.compile(pattern).groups
+            alternatives.append(f'.*?(?P<{intent}__{i}>{pattern})')
+            branches[group_index] = (intent, capture_count)
+            group_index += 1 + capture_count
+    
+    return re.compile('|'.join(alternatives), re.IGNORECASE), branches
+
+def _build_intent_database(intent_patterns: Dict[str, List[str]]):
+    """Compile every intent pattern into one Hyperscan database (None without hyperscan)
+    
+    Pattern ids follow declaration order, so the lowest matching id is the
+    intent the regex alternation would pick. Returns (database, [(intent, compiled re)]).
+    """
+    if not HAVE_HYPERSCAN:
+        return None
+    
+    patterns = [(intent, pattern) for intent, intent_list in intent_patterns.items() for pattern in intent_list]
+    flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH |
+             hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode() for _, pattern in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[flags] * len(patterns),
+    )
+    return database, [(intent, re.compile(pattern, re.IGNORECASE)) for intent, pattern in patterns]
+
+def _build_verb_index(intent_patterns: Dict[str, List[str]]) -> Dict[str, List[Tuple[str, re.Pattern]]]:
+    """Bucket patterns by their leading literal verb, keeping declaration order within a bucket"""
+    verb_index = {}
+    for intent, patterns in intent_patterns.items():
+        for pattern in patterns:
+            verb = re.match(r'[a-z]+', pattern).group()
+            verb_index.setdefault(verb, []).append((intent, re.compile(pattern, re.IGNORECASE)))
+    return verb_index
+
+def _build_context_automaton(context_keywords: Dict[str, List[str]]):
+    """Build an Aho-Corasick automaton over all context keywords (None without pyahocorasick)"""
+    if not HAVE_AHOCORASICK:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for category, keywords in context_keywords.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (category, keyword))
+    automaton.make_automaton()
+    return automaton
+
 class IntelligentFileManager:
+    _ARTICLE_RE = re.compile(r'^(?:a |an |the )')
+    _FILLER_RE = re.compile(r"i'd like to|can you|please|would you")
+    _INVALID_CHARS_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+    SEARCH_RESULT_LIMIT = 50
+    # Calibrated on single-edit typos of common file names: transpositions,
+    # deletions and insertions all score above it, unrelated names rarely do
+    SIMILARITY_THRESHOLD = 0.3
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+    
+    # Intent patterns with natural language understanding
+    INTENT_PATTERNS = {
+        'create_file': [
+            r'create (?:a )?file (?:named |called )?(.+)',
+            r'make (?:a )?file (?:named |called )?(.+)', 
+            r'new file (?:named |called )?(.+)',
+            r'touch (.+)',
+            r'create (.+\.[\w]+)',  # Extensions
+        ],
+        'create_directory': [
+            r'create (?:a )?(?:folder|directory) (?:named |called )?(.+)',
+            r'make (?:a )?(?:folder|directory) (?:named |called )?(.+)',
+            r'new (?:folder|directory) (?:named |called )?(.+)',
+            r'mkdir (.+)',
+        ],
+        'find_file': [
+            r'find (?:a |the )?file (?:named |called )?(.+)',
+            r'search for (?:a |the )?file (?:named |called )?(.+)',
+            r'locate (?:a |the )?file (?:named |called )?(.+)',
+            r'where is (?:the )?file (?:named |called )?(.+)',
+            r'look for (.+)',
+            r'find (.+)',
+        ],
+        'open_file': [
+            r'open (?:the )?file (?:named |called )?(.+)',
+            r'launch (?:the )?file (?:named |called )?(.+)',
+            r'run (?:the )?file (?:named |called )?(.+)',
+            r'open (.+)',
+        ],
+        'delete_file': [
+            r'delete (?:the )?file (?:named |called )?(.+)',
+            r'remove (?:the )?file (?:named |called )?(.+)',
+            r'trash (?:the )?file (?:named |called )?(.+)',
+            r'delete (.+)',
+            r'rm (.+)',
+        ],
+        'list_files': [
+            r'list (?:all )?(?:the )?files',
+            r'show (?:me )?(?:all )?(?:the )?files',
+            r'what files are (?:in )?here',
+            r'display (?:the )?contents',
+            r'ls',
+            r'dir',
+        ],
+        'copy_file': [
+            r'copy (?:the )?file (.+) to (.+)',
+            r'duplicate (?:the )?file (.+) (?:to|as) (.+)',
+            r'cp (.+) (.+)',
+        ],
+        'move_file': [
+            r'move (?:the )?file (.+) to (.+)',
+            r'rename (?:the )?file (.+) (?:to|as) (.+)',
+            r'mv (.+) (.+)',
+        ],
+    }
+    _MASTER_RE, _MASTER_BRANCHES = _build_master_pattern(INTENT_PATTERNS)
+    _INTENT_DATABASE = _build_intent_database(INTENT_PATTERNS)
+    _VERB_PATTERNS = _build_verb_index(INTENT_PATTERNS)
+    
+    # Context understanding
+    CONTEXT_KEYWORDS = {
+        'urgency': ['urgent', 'quickly', 'asap', 'now', 'immediately'],
+        'size': ['large', 'big', 'small', 'tiny', 'huge'],
+        'type': ['document', 'image', 'video', 'audio', 'text', 'script'],
+        'location': ['desktop', 'documents', 'downloads', 'home'],
+    }
+    _CONTEXT_AUTOMATON = _build_context_automaton(CONTEXT_KEYWORDS)
+    
+    _ICON_MAP = {
+        '.py': '🐍', '.js': '📜', '.html': '🌐', '.css': '🎨',
+        '.txt': '📄', '.md': '📝', '.pdf': '📕',
+        '.jpg': '🖼️', '.png': '🖼️', '.gif': '🖼️',
+        '.mp3': '🎵', '.mp4': '🎬', '.zip': '🗜️'
+    }
+    
     def __init__(self):
         self.current_directory = Path.home()
         
-        # Intent patterns with natural language understanding
-        self.intent_patterns = {
-            'create_file': [
-                r'create (?:a )?file (?:named |called )?(.+)',
-                r'make (?:a )?file (?:named |called )?(.+)', 
-                r'new file (?:named |called )?(.+)',
-                r'touch (.+)',
-                r'create (.+\.[\w]+)',  # Extensions
-            ],
-            'create_directory': [
-                r'create (?:a )?(?:folder|directory) (?:named |called )?(.+)',
-                r'make (?:a )?(?:folder|directory) (?:named |called )?(.+)',
-                r'new (?:folder|directory) (?:named |called )?(.+)',
-                r'mkdir (.+)',
-            ],
-            'find_file': [
-                r'find (?:a |the )?file (?:named |called )?(.+)',
-                r'search for (?:a |the )?file (?:named |called )?(.+)',
-                r'locate (?:a |the )?file (?:named |called )?(.+)',
-                r'where is (?:the )?file (?:named |called )?(.+)',
-                r'look for (.+)',
-                r'find (.+)',
-            ],
-            'open_file': [
-                r'open (?:the )?file (?:named |called )?(.+)',
-                r'launch (?:the )?file (?:named |called )?(.+)',
-                r'run (?:the )?file (?:named |called )?(.+)',
-                r'open (.+)',
-            ],
-            'delete_file': [
-                r'delete (?:the )?file (?:named |called )?(.+)',
-                r'remove (?:the )?file (?:named |called )?(.+)',
-                r'trash (?:the )?file (?:named |called )?(.+)',
-                r'delete (.+)',
-                r'rm (.+)',
-            ],
-            'list_files': [
-                r'list (?:all )?(?:the )?files',
-                r'show (?:me )?(?:all )?(?:the )?files',
-                r'what files are (?:in )?here',
-                r'display (?:the )?contents',
-                r'ls',
-                r'dir',
-            ],
-            'copy_file': [
-                r'copy (?:the )?file (.+) to (.+)',
-                r'duplicate (?:the )?file (.+) (?:to|as) (.+)',
-                r'cp (.+) (.+)',
-            ],
-            'move_file': [
-                r'move (?:the )?file (.+) to (.+)',
-                r'rename (?:the )?file (.+) (?:to|as) (.+)',
-                r'mv (.+) (.+)',
-            ],
-        }
-        
-        # Context understanding
-        self.context_keywords = {
-            'urgency': ['urgent', 'quickly', 'asap', 'now', 'immediately'],
-            'size': ['large', 'big', 'small', 'tiny', 'huge'],
-            'type': ['document', 'image', 'video', 'audio', 'text', 'script'],
-            'location': ['desktop', 'documents', 'downloads', 'home'],
+        # Directory listings keyed by path string:
+        # (st_mtime_ns, names, lower_name -> name, [(name, lower_name), ...])
+        self._dir_cache: Dict[str, Tuple[int, Set[str], Dict[str, str], List[Tuple[str, str]]]] = {}
+        
+        # Intent -> handler dispatch table
+        self._dispatch = {
+            'create_file': self._create_file,
+            'create_directory': self._create_directory,
+            'find_file': self._find_file,
+            'open_file': self._open_file,
+            'delete_file': self._delete_file,
+            'list_files': self._list_files,
+            'copy_file': self._copy_file,
+            'move_file': self._move_file,
         }
     
+    @property
+    def current_directory(self) -> Path:
+        return self._current_directory
+    
+    @current_directory.setter
+    def current_directory(self, path: Path):
+        # Keep a str copy for os-level walks so hot loops never build Path objects
+        self._current_directory = Path(path)
+        self._cwd_str = str(self._current_directory)
+    
     def process_command(self, user_input: str) -> str:
         """Process natural language command with intelligent understanding"""
         # Clean and normalize input
@@ -97,35 +221,82 @@ class IntelligentFileManager:
     def _preprocess_text(self, text: str) -> str:
         """Clean and normalize text for better understanding"""
         # Remove extra whitespace
-        text = ' '.join(text.split())
+        text = ' '.join(text.lower().split())
         
-        # Handle common contractions and variations
-        text = text.replace("i'd like to", "")
-        text = text.replace("can you", "")
-        text = text.replace("please", "")
-        text = text.replace("would you", "")
+        # Handle common contractions and variations in one pass
+        text = self._FILLER_RE.sub('', text)
         
-        return text.lower().strip()
+        return text.strip()
     
     def _extract_intent_and_entities(self, text: str) -> Tuple[Optional[str], Dict]:
         """Extract intent and entities using pattern matching"""
-        for intent, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    entities = {
-                        'groups': match.groups(),
-                        'context': self._extract_context(text)
-                    }
-                    return intent, entities
-        
-        return None, {}
+        # Commands usually lead with their verb: try only that verb's patterns, anchored
+        for intent, pattern in self._VERB_PATTERNS.get(text.split(' ', 1)[0], ()):
+            match = pattern.match(text)
+            if match:
+                return intent, self._build_entities(text, match)
+        
+        if self._INTENT_DATABASE is not None:
+            return self._extract_intent_hyperscan(text)
+        
+        match = self._MASTER_RE.match(text)
+        if not match:
+            return None, {}
+        
+        # The branch wrapper group closes last, so lastindex identifies the branch
+        branch = match.lastindex
+        intent, capture_count = self._MASTER_BRANCHES[branch]
+        return intent, self._build_entities(text, match, branch + 1, capture_count)
+    
+    def _build_entities(self, text: str, match: re.Match, first_group: int = 1,
+                        capture_count: Optional[int] = None) -> Dict:
+        """Pull the (at most two) captured arguments straight off the match, plus context"""
+        if capture_count is None:
+            capture_count = match.re.groups
+        return {
+            'arg1': match.group(first_group) if capture_count >= 1 else None,
+            'arg2': match.group(first_group + 1) if capture_count >= 2 else None,
+            'context': self._extract_context(text)
+        }
+    
+    def _extract_intent_hyperscan(self, text: str) -> Tuple[Optional[str], Dict]:
+        """Find the winning pattern with one Hyperscan pass, then capture with its regex"""
+        database, patterns = self._INTENT_DATABASE
+        matched_ids = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            matched_ids.append(pattern_id)
+            # Pattern 0 has top priority, nothing can beat it
+            return pattern_id == 0
+        
+        try:
+            database.scan(text.encode(), match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass
+        if not matched_ids:
+            return None, {}
+        
+        # Hyperscan only reports which pattern matched, captures come from re
+        intent, pattern = patterns[min(matched_ids)]
+        match = pattern.search(text)
+        if not match:
+            return None, {}
+        
+        return intent, self._build_entities(text, match)
     
     def _extract_context(self, text: str) -> Dict:
         """Extract contextual information"""
         context = {}
         
-        for category, keywords in self.context_keywords.items():
+        # Single pass over the text for every keyword at once
+        if self._CONTEXT_AUTOMATON is not None:
+            for _, (category, keyword) in self._CONTEXT_AUTOMATON.iter(text):
+                found = context.setdefault(category, [])
+                if keyword not in found:
+                    found.append(keyword)
+            return context
+        
+        for category, keywords in self.CONTEXT_KEYWORDS.items():
             found = [kw for kw in keywords if kw in text]
             if found:
                 context[category] = found
@@ -135,35 +306,21 @@ class IntelligentFileManager:
     def _execute_intent(self, intent: str, entities: Dict, original_text: str) -> str:
         """Execute the identified intent"""
         try:
-            if intent == 'create_file':
-                return self._create_file(entities)
-            elif intent == 'create_directory':
-                return self._create_directory(entities)
-            elif intent == 'find_file':
-                return self._find_file(entities)
-            elif intent == 'open_file':
-                return self._open_file(entities)
-            elif intent == 'delete_file':
-                return self._delete_file(entities)
-            elif intent == 'list_files':
-                return self._list_files(entities)
-            elif intent == 'copy_file':
-                return self._copy_file(entities)
-            elif intent == 'move_file':
-                return self._move_file(entities)
-            else:
-                return f"❓ **Intent recognized** ({intent}) but not implemented yet"
+            handler = self._dispatch.get(intent)
+            if handler:
+                return handler(entities)
+            return f"❓ **Intent recognized** ({intent}) but not implemented yet"
                 
         except Exception as e:
             return f"❌ **Error executing {intent}:** {str(e)}"
     
     def _create_file(self, entities: Dict) -> str:
         """Create file with intelligent name extraction"""
-        groups = entities.get('groups', [])
-        if not groups or not groups[0]:
+        filename = entities.get('arg1')
+        if not filename:
             return "📄 **Please specify the filename to create**"
         
-        filename = groups[0].strip()
+        filename = filename.strip()
         
         # Clean filename
         filename = self._clean_filename(filename)
@@ -188,11 +345,11 @@ class IntelligentFileManager:
     
     def _create_directory(self, entities: Dict) -> str:
         """Create directory with intelligent understanding"""
-        groups = entities.get('groups', [])
-        if not groups or not groups[0]:
+        dirname = entities.get('arg1')
+        if not dirname:
             return "📁 **Please specify the directory name to create**"
         
-        dirname = groups[0].strip()
+        dirname = dirname.strip()
         dirname = self._clean_filename(dirname)
         
         try:
@@ -209,60 +366,101 @@ class IntelligentFileManager:
     
     def _find_file(self, entities: Dict) -> str:
         """Find files with intelligent search"""
-        groups = entities.get('groups', [])
-        if not groups or not groups[0]:
+        search_term = entities.get('arg1')
+        if not search_term:
             return "🔍 **Please specify what to search for**"
         
-        search_term = groups[0].strip()
+        search_term = search_term.strip()
         
         try:
-            # Multi-strategy search
-            results = []
-            
-            # Exact name match
-            exact_matches = list(self.current_directory.rglob(search_term))
-            results.extend(exact_matches)
-            
-            # Partial name match
-            if not exact_matches:
-                partial_matches = list(self.current_directory.rglob(f"*{search_term}*"))
-                results.extend(partial_matches)
-            
-            # Extension-based search if search term looks like extension
-            if search_term.startswith('.') or '.' in search_term:
-                ext_matches = list(self.current_directory.rglob(f"*{search_term}"))
-                results.extend(ext_matches)
-            
-            # Remove duplicates
-            results = list(set(results))
+            results, truncated = self._search_tree(search_term, self.SEARCH_RESULT_LIMIT)
             
             if not results:
                 return f"🔍 **No files found** matching '{search_term}'\n\n**Suggestions:**\n• Check spelling\n• Try partial filename\n• Use wildcards"
             
-            response = f"🔍 **Found {len(results)} file(s)** matching '{search_term}':\n\n"
+            result_count = f"{len(results)}+" if truncated else str(len(results))
+            parts = [f"🔍 **Found {result_count} file(s)** matching '{search_term}':\n\n"]
             
-            for file_path in results[:10]:
-                icon = "📁" if file_path.is_dir() else self._get_file_icon(file_path)
-                size = self._format_size(file_path.stat().st_size) if file_path.is_file() else ""
-                relative_path = file_path.relative_to(self.current_directory)
+            for entry in results[:10]:
+                # DirEntry type checks and stat come from the directory read
+                is_dir = entry.is_dir()
+                icon = self._get_file_icon(entry, is_dir)
+                size = self._format_size(entry.stat().st_size) if not is_dir and entry.is_file() else ""
+                relative_path = os.path.relpath(entry.path, self._cwd_str)
                 
-                response += f"{icon} **{file_path.name}** {size}\n   └─ `{relative_path}`\n"
+                parts.append(f"{icon} **{entry.name}** {size}\n   └─ `{relative_path}`\n")
             
             if len(results) > 10:
-                response += f"\n*(Showing first 10 of {len(results)} results)*"
+                parts.append(f"\n*(Showing first 10 of {result_count} results)*")
             
-            return response
+            return ''.join(parts)
             
         except Exception as e:
             return f"❌ **Search failed:** {str(e)}"
     
+    def _search_tree(self, search_term: str, limit: int) -> Tuple[List[os.DirEntry], bool]:
+        """Walk the current directory once for exact, extension and partial name matches
+        
+        As with separate searches per strategy, partial matches are only reported
+        when nothing matches exactly; a term containing '.' also reports names
+        ending in it. Those shown-anyway hits stop the walk after `limit`, while
+        partials are capped on their own so they never hide a deeper exact match.
+        The flag reports whether the results were cut short.
+        """
+        exact_re = re.compile(fnmatch.translate(search_term))
+        partial_re = re.compile(fnmatch.translate(f"*{search_term}*"))
+        suffix_re = re.compile(fnmatch.translate(f"*{search_term}")) if '.' in search_term else None
+        exact, suffix, partial = [], [], []
+        truncated = False
+        
+        for entry in self._walk(self._cwd_str):
+            name = entry.name
+            if exact_re.match(name):
+                exact.append(entry)
+            elif suffix_re is not None and suffix_re.match(name):
+                suffix.append(entry)
+            elif not exact and partial_re.match(name):
+                # Only needed while nothing matched exactly
+                if len(partial) < limit:
+                    partial.append(entry)
+                else:
+                    truncated = True
+                continue
+            else:
+                continue
+            
+            if len(exact) + len(suffix) >= limit:
+                truncated = True
+                break
+        
+        if exact:
+            return exact + suffix, len(exact) + len(suffix) >= limit
+        
+        results = suffix + partial
+        return results[:limit], truncated or len(results) > limit
+    
+    @staticmethod
+    def _walk(root: str):
+        """Yield every DirEntry below root depth-first, without following symlinked dirs"""
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        yield entry
+            except OSError:
+                # Unreadable directories are skipped, as os.walk does
+                continue
+    
     def _open_file(self, entities: Dict) -> str:
         """Open file with intelligent resolution"""
-        groups = entities.get('groups', [])
-        if not groups or not groups[0]:
+        filename = entities.get('arg1')
+        if not filename:
             return "📂 **Please specify the file to open**"
         
-        filename = groups[0].strip()
+        filename = filename.strip()
         resolved_path = self._resolve_path(filename)
         
         if not resolved_path:
@@ -291,11 +489,11 @@ class IntelligentFileManager:
     
     def _delete_file(self, entities: Dict) -> str:
         """Delete file with confirmation"""
-        groups = entities.get('groups', [])
-        if not groups or not groups[0]:
+        filename = entities.get('arg1')
+        if not filename:
             return "🗑️ **Please specify the file to delete**"
         
-        filename = groups[0].strip()
+        filename = filename.strip()
         resolved_path = self._resolve_path(filename)
         
         if not resolved_path:
@@ -318,40 +516,46 @@ class IntelligentFileManager:
     def _list_files(self, entities: Dict) -> str:
         """List files in current directory"""
         try:
-            files = list(self.current_directory.iterdir())
-            files.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
+            # DirEntry caches is_dir()/stat() from the directory read; each record is
+            # (is_file, lower_name, name, entry) so the sort needs no key function.
+            # Names are unique, so the comparison never reaches the entry itself.
+            with os.scandir(self._cwd_str) as it:
+                files = [(not entry.is_dir(), entry.name.lower(), entry.name, entry) for entry in it]
+            files.sort()
             
             if not files:
                 return f"📁 **Empty directory:** `{self.current_directory}`"
             
-            response = f"📁 **Directory:** `{self.current_directory}`\n\n"
+            parts = [f"📁 **Directory:** `{self.current_directory}`\n\n"]
             
-            for file_path in files[:20]:
-                icon = self._get_file_icon(file_path)
+            for is_file, _, name, entry in files[:20]:
+                icon = self._get_file_icon(entry, not is_file)
                 
-                if file_path.is_dir():
-                    item_count = len(list(file_path.iterdir()))
-                    size_info = f"({item_count} items)"
+                if is_file:
+                    size_info = self._format_size(entry.stat().st_size)
                 else:
-                    size_info = self._format_size(file_path.stat().st_size)
+                    # Count children without materializing a list or Path objects
+                    with os.scandir(entry.path) as children:
+                        item_count = sum(1 for _ in children)
+                    size_info = f"({item_count} items)"
                 
-                response += f"{icon} **{file_path.name}** {size_info}\n"
+                parts.append(f"{icon} **{name}** {size_info}\n")
             
             if len(files) > 20:
-                response += f"\n*(Showing first 20 of {len(files)} items)*"
+                parts.append(f"\n*(Showing first 20 of {len(files)} items)*")
             
-            return response
+            return ''.join(parts)
         
         except Exception as e:
             return f"❌ **List failed:** {str(e)}"
     
     def _copy_file(self, entities: Dict) -> str:
         """Copy file with intelligent understanding"""
-        groups = entities.get('groups', [])
-        if len(groups) < 2:
+        source_name, dest_name = entities.get('arg1'), entities.get('arg2')
+        if not source_name or not dest_name:
             return "📋 **Copy:** Please specify source and destination\n**Example:** copy report.pdf to backup folder"
         
-        source_name, dest_name = groups[0].strip(), groups[1].strip()
+        source_name, dest_name = source_name.strip(), dest_name.strip()
         source_path = self._resolve_path(source_name)
         
         if not source_path:
@@ -366,19 +570,47 @@ class IntelligentFileManager:
             else:
                 if dest_path.is_dir():
                     dest_path = dest_path / source_path.name
-                shutil.copy2(source_path, dest_path)
+                self._fast_copy(source_path, dest_path)
                 return f"📋 **Copied file:** {source_name} → {dest_name}"
         
         except Exception as e:
             return f"❌ **Copy failed:** {str(e)}"
     
+    @staticmethod
+    def _fast_copy(source: Path, dest: Path):
+        """Copy a file in-kernel with copy_file_range, falling back to shutil.copy2"""
+        if not hasattr(os, 'copy_file_range'):
+            shutil.copy2(source, dest)
+            return
+        
+        # Opening dest truncates it, so refuse self-copies up front like copy2 does
+        if dest.exists() and os.path.samefile(source, dest):
+            raise shutil.SameFileError(f"{source} and {dest} are the same file")
+        
+        try:
+            with open(source, 'rb') as fsrc, open(dest, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+        except OSError as e:
+            # Cross-filesystem on older kernels or unsupported filesystem
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+            shutil.copy2(source, dest)
+            return
+        
+        shutil.copystat(source, dest)
+    
     def _move_file(self, entities: Dict) -> str:
         """Move/rename file"""
-        groups = entities.get('groups', [])
-        if len(groups) < 2:
+        source_name, dest_name = entities.get('arg1'), entities.get('arg2')
+        if not source_name or not dest_name:
             return "🔄 **Move:** Please specify source and destination"
         
-        source_name, dest_name = groups[0].strip(), groups[1].strip()
+        source_name, dest_name = source_name.strip(), dest_name.strip()
         source_path = self._resolve_path(source_name)
         
         if not source_path:
@@ -395,16 +627,18 @@ class IntelligentFileManager:
     
     def _resolve_path(self, filename: str) -> Optional[Path]:
         """Intelligently resolve file path"""
-        # Direct match
+        _, names, by_lower, _ = self._get_dir_index(self._cwd_str)
+        
+        # Direct match, then case-insensitive match from the cached listing
+        name = filename if filename in names else by_lower.get(filename.lower())
+        if name is not None:
+            return self.current_directory / name
+        
+        # Nested/absolute paths are not in the listing
         direct_path = self.current_directory / filename
         if direct_path.exists():
             return direct_path
         
-        # Case-insensitive search
-        for item in self.current_directory.iterdir():
-            if item.name.lower() == filename.lower():
-                return item
-        
         # Partial match
         matches = list(self.current_directory.glob(f"*{filename}*"))
         if matches:
@@ -412,19 +646,40 @@ class IntelligentFileManager:
         
         return None
     
+    def _get_dir_index(self, directory: str) -> Tuple[int, Set[str], Dict[str, str], List[Tuple[str, str]]]:
+        """Return the cached listing of directory, re-reading it only when its mtime changes"""
+        mtime = os.stat(directory).st_mtime_ns
+        cached = self._dir_cache.get(directory)
+        if cached and cached[0] == mtime:
+            return cached
+        
+        names = os.listdir(directory)
+        entries = [(name, name.lower()) for name in names]
+        by_lower = {}
+        for name, name_lower in entries:
+            by_lower.setdefault(name_lower, name)
+        
+        self._dir_cache[directory] = (mtime, set(names), by_lower, entries)
+        return self._dir_cache[directory]
+    
     def _find_similar_files(self, target: str) -> List[Path]:
         """Find similar files for suggestions"""
-        all_files = list(self.current_directory.iterdir())
-        suggestions = []
-        
-        for file_path in all_files:
-            similarity = self._calculate_similarity(file_path.name.lower(), target.lower())
-            if similarity > 0.4:
-                suggestions.append(file_path)
-        
-        return sorted(suggestions, key=lambda x: self._calculate_similarity(x.name.lower(), target.lower()), reverse=True)[:5]
+        target = target.lower()
+        target_fingerprint = self._fingerprint(target)
+        scored = []
+        
+        # Score each file once and reuse it for both filtering and ranking
+        _, _, _, entries = self._get_dir_index(self._cwd_str)
+        for name, name_lower in entries:
+            similarity = self._calculate_similarity(name_lower, target, target_fingerprint)
+            if similarity > self.SIMILARITY_THRESHOLD:
+                scored.append((similarity, name))
+        
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [self.current_directory / name for _, name in scored[:5]]
     
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
+    def _calculate_similarity(self, str1: str, str2: str,
+                              fingerprint2: Optional[Tuple[int, int]] = None) -> float:
         """Calculate string similarity"""
         if str1 == str2:
             return 1.0
@@ -432,43 +687,64 @@ class IntelligentFileManager:
         if str1 in str2 or str2 in str1:
             return 0.8
         
-        # Simple Jaccard similarity
-        set1, set2 = set(str1), set(str2)
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
-        
-        return intersection / union if union > 0 else 0.0
+        # Mean of the character-set and 2-gram Jaccard similarities: the
+        # character set tolerates transposed letters, the 2-grams keep names
+        # that merely share letters from scoring high
+        chars1, bigrams1 = self._fingerprint(str1)
+        chars2, bigrams2 = fingerprint2 if fingerprint2 is not None else self._fingerprint(str2)
+        return (self._jaccard(chars1, chars2) + self._jaccard(bigrams1, bigrams2)) / 2
+    
+    @staticmethod
+    def _jaccard(mask1: int, mask2: int) -> float:
+        """Jaccard similarity of two bitmask sets"""
+        union = (mask1 | mask2).bit_count()
+        return (mask1 & mask2).bit_count() / union if union > 0 else 0.0
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _fingerprint(name: str) -> Tuple[int, int]:
+        """(UTF-8 byte presence mask, 1024-bit mask of hashed padded 2-grams) of name (memoized)"""
+        chars = 0
+        for code in set(name.encode()):
+            chars |= 1 << code
+        
+        # crc32 rather than hash(), which is salted per process
+        padded = f" {name} ".encode()
+        bigrams = 0
+        for i in range(len(padded) - 1):
+            bigrams |= 1 << (zlib.crc32(padded[i:i + 2]) & 1023)
+        return chars, bigrams
     
     def _clean_filename(self, filename: str) -> str:
         """Clean filename from natural language artifacts"""
         # Remove common natural language artifacts
-        filename = re.sub(r'^(?:a |an |the )', '', filename)
-        filename = re.sub(r'[<>:"/\\|?*]', '', filename)  # Invalid file chars
+        filename = self._ARTICLE_RE.sub('', filename)
+        filename = filename.translate(self._INVALID_CHARS_TABLE)  # Invalid file chars
         filename = filename.strip()
         
         return filename
     
-    def _get_file_icon(self, file_path: Path) -> str:
-        """Get file icon based on type"""
-        if file_path.is_dir():
+    def _get_file_icon(self, file_path: Union[Path, os.DirEntry], is_dir: Optional[bool] = None) -> str:
+        """Get file icon based on type (pass is_dir when already known to skip the check)"""
+        if is_dir is None:
+            is_dir = file_path.is_dir()
+        if is_dir:
             return "📁"
         
-        suffix = file_path.suffix.lower()
-        icon_map = {
-            '.py': '🐍', '.js': '📜', '.html': '🌐', '.css': '🎨',
-            '.txt': '📄', '.md': '📝', '.pdf': '📕',
-            '.jpg': '🖼️', '.png': '🖼️', '.gif': '🖼️',
-            '.mp3': '🎵', '.mp4': '🎬', '.zip': '🗜️'
-        }
-        return icon_map.get(suffix, '📄')
+        _, dot, extension = file_path.name.rpartition('.')
+        return self._icon_for_suffix(dot + extension if dot else '')
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _icon_for_suffix(suffix: str) -> str:
+        """Icon for a raw (any case) suffix, memoized so each distinct suffix is lowered once"""
+        return IntelligentFileManager._ICON_MAP.get(suffix.lower(), '📄')
     
     def _format_size(self, size_bytes: int) -> str:
         """Format file size"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        # Every 10 bits of length is one 1024x unit step
+        unit = min((size_bytes.bit_length() - 1) // 10, 4) if size_bytes else 0
+        return f"{size_bytes / (1 << (unit * 10)):.1f} {self._SIZE_UNITS[unit]}"
     
     def _add_template_content(self, file_path: Path, content_type: List[str]):
         """Add template content based on context"""
@@ -10,16 +10,162 @@ import os
 import time
 import requests
 import json
+import re
 import sys
 import signal
 import shutil
-from pathlib import Path
+import functools
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# `data:` line of an SSE stream; surrounding whitespace (including \r) is excluded
+_SSE_DATA_RE = re.compile(rb"data: \s*(.*?)\s*")
+
+# SSE payloads are parsed straight from bytes; orjson is several times faster when present
+_json_loads = orjson.loads if HAVE_ORJSON else json.loads
 
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, GLib, Adw, Gdk
 
+# Shared HTTP session so llama-server calls reuse pooled connections. Only one
+# host is ever contacted; two sockets cover a stream plus a readiness probe.
+# pool_block stays off so a probe on the UI thread never waits on a stream.
+_SESSION = requests.Session()
+_SESSION.headers["Connection"] = "keep-alive"
+_SESSION.mount("http://127.0.0.1", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+_SERVER_PATHS = (
+    "./llama.cpp/build/bin/llama-server",
+    "./build/bin/llama-server",
+    "./llama-server",
+    "llama-server"
+)
+_LLAMAFILE_NAME = "Phi-3-mini-4k-instruct.Q4_0.llamafile"
+
+@functools.lru_cache(maxsize=1)
+def _discover_engines(cwd):
+    """Find (server_path, model_path, llamafile_path) in one pass over cwd"""
+    server_path = None
+    for path in _SERVER_PATHS:
+        if os.path.exists(os.path.join(cwd, path)):
+            server_path = path
+            break
+        elif shutil.which(path.split('/')[-1]):
+            server_path = path.split('/')[-1]
+            break
+    
+    # One slot per pattern, filled by the first match, so priority order is kept:
+    # *.gguf before *.bin; exact llamafile name, *.llamafile, *phi*llamafile*, *llamafile*
+    models = [None, None]
+    llamafiles = [None, None, None, None]
+    try:
+        with os.scandir(cwd) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+                if name.endswith('.gguf'):
+                    models[0] = models[0] or name
+                elif name.endswith('.bin'):
+                    models[1] = models[1] or name
+                if 'llamafile' not in name:
+                    continue
+                if name == _LLAMAFILE_NAME:
+                    slot = 0
+                elif name.endswith('.llamafile'):
+                    slot = 1
+                elif 'phi' in name and 'llamafile' in name[name.index('phi') + 3:]:
+                    slot = 2
+                else:
+                    slot = 3
+                llamafiles[slot] = llamafiles[slot] or entry.path
+    except OSError:
+        pass
+    
+    model_path = next((m for m in models if m), None)
+    llamafile_path = next((f for f in llamafiles if f), None)
+    if llamafile_path:
+        llamafile_path = os.path.realpath(llamafile_path)
+    return server_path, model_path, llamafile_path
+
+@functools.lru_cache(maxsize=4)
+def _server_help(server_path):
+    """Return `llama-server --help` output for flag detection ('' if it cannot run)"""
+    try:
+        result = subprocess.run(
+            [server_path, "--help"], capture_output=True, text=True, timeout=10
+        )
+        return result.stdout + result.stderr
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+# Stylesheets are kept as bytes so load_from_data needs no per-call encode
+_CSS_DESKTOP = b"""
+.chat-area {
+    background-color: @view_bg_color;
+}
+.large-entry {
+    min-height: 52px;
+    font-size: 16px;
+    border-radius: 26px;
+    padding: 0 24px;
+}
+.message-bubble {
+    border-radius: 24px;
+    padding: 16px 24px;
+    margin: 8px 0;
+    font-size: 15px;
+}
+.user-message {
+    background-color: @accent_color;
+    color: @accent_fg_color;
+}
+.ai-message {
+    background-color: @card_bg_color;
+    border: 1px solid @borders;
+}
+"""
+
+_CSS_NORMAL = b"""
+.chat-area {
+    background-color: @view_bg_color;
+}
+.large-entry {
+    min-height: 42px;
+    font-size: 14px;
+}
+.message-bubble {
+    border-radius: 18px;
+    padding: 12px 16px;
+    margin: 4px 0;
+}
+.user-message {
+    background-color: @accent_color;
+    color: @accent_fg_color;
+}
+.ai-message {
+    background-color: @card_bg_color;
+    border: 1px solid @borders;
+}
+"""
+
+class _NullStatus:
+    """Stand-in for the status label in layouts that have none"""
+    __slots__ = ()
+    
+    def set_text(self, *args):
+        pass
+
 class MinimalAIShell(Adw.ApplicationWindow):
+    _css_providers = {}
+    _css_installed = False  # the provider is display-wide, so install it once
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
@@ -27,7 +173,44 @@ class MinimalAIShell(Adw.ApplicationWindow):
         self.desktop_mode = '--fullscreen-mode' in sys.argv or '--desktop-mode' in sys.argv
         self.server_url = "http://127.0.0.1:8080"
         self.server_process = None
+        self.server_lock = threading.Lock()  # guards against a double start
+        self.server_starting = False
+        self.server_launch_id = 0  # bumped per launch; only the current one clears server_starting
+        self.session_pids = []  # processes started by this session, signalled on close
         self.response_timeout = 10
+        # Replaced by the header label when Desktop Manager builds one
+        self.ai_status = _NullStatus()
+        
+        # Readiness cache: probes are trusted for ready_ttl seconds, and once the
+        # engine is confirmed up sends skip the probe until a request fails
+        self.ready_until = 0.0
+        self.ready_ttl = 5.0
+        self.server_confirmed = False
+        
+        # Streaming state: the worker thread publishes text under the lock and
+        # a UI tick renders it, so redraws are bounded by the refresh rate
+        self.stream_lock = threading.Lock()
+        self.stream_chunks = []
+        self.stream_dirty = False
+        self.stream_finished = False
+        self.stream_label = None
+        self.stream_tick_id = None
+        self.stream_refresh_ms = 33
+        # Set to abandon the in-flight response; each stream gets a fresh Event
+        self.stream_cancel = threading.Event()
+        
+        # Bubble layout per mode: (bubble padding l/r, bubble padding t/b, side inset)
+        self.msg_margins = (24, 16, 120) if self.desktop_mode else (16, 12, 80)
+        # Timestamps only change once a minute, so the formatted string is reused
+        self.last_minute = -1
+        self.last_time_str = ""
+        
+        # Oldest bubbles are dropped past this many to bound widget count and relayout cost
+        self.bubble_count = 0
+        self.max_bubbles = 200
+        
+        # At most one scroll idle callback is queued at a time
+        self.scroll_pending = False
         
         # Connect to Desktop Manager (this is the ONLY external connection)
         self.desktop_manager = None
@@ -39,7 +222,6 @@ class MinimalAIShell(Adw.ApplicationWindow):
             self.setup_desktop_mode()
         
         self.setup_ui()
-        self.start_server()
         self.setup_keyboard_shortcuts()
     
     def connect_desktop_manager(self):
@@ -68,6 +250,15 @@ class MinimalAIShell(Adw.ApplicationWindow):
         """Handle desktop session close gracefully"""
         if self.desktop_mode:
             print("🔄 Closing PersonalAIOS Desktop Session")
+            if self.session_pids:
+                for pid in self.session_pids:
+                    try:
+                        os.kill(pid, signal.SIGTERM)
+                    except (ProcessLookupError, PermissionError):
+                        pass
+                return
+            
+            # Nothing tracked: fall back to matching the session by name
             try:
                 subprocess.run(['pkill', '-u', os.getenv('USER'), '-f', 'personalaios-session'], 
                              timeout=2, check=False)
@@ -101,10 +292,11 @@ class MinimalAIShell(Adw.ApplicationWindow):
     
     def restart_ai_server(self):
         """Restart AI server"""
-        if hasattr(self, 'ai_status'):
-            self.ai_status.set_text("🔄 Restarting AI Engine...")
+        self.ai_status.set_text("🔄 Restarting AI Engine...")
         if self.server_process:
             self.cleanup()
+        # Rescan so a freshly downloaded model or llamafile is picked up
+        _discover_engines.cache_clear()
         threading.Thread(target=self.start_server, daemon=True).start()
     
     def setup_ui(self):
@@ -172,65 +364,22 @@ class MinimalAIShell(Adw.ApplicationWindow):
     
     def load_custom_css(self):
         """Load custom CSS for aesthetics"""
-        css_provider = Gtk.CssProvider()
-        
-        if self.desktop_mode:
-            css_data = """
-            .chat-area {
-                background-color: @view_bg_color;
-            }
-            .large-entry {
-                min-height: 52px;
-                font-size: 16px;
-                border-radius: 26px;
-                padding: 0 24px;
-            }
-            .message-bubble {
-                border-radius: 24px;
-                padding: 16px 24px;
-                margin: 8px 0;
-                font-size: 15px;
-            }
-            .user-message {
-                background-color: @accent_color;
-                color: @accent_fg_color;
-            }
-            .ai-message {
-                background-color: @card_bg_color;
-                border: 1px solid @borders;
-            }
-            """
-        else:
-            css_data = """
-            .chat-area {
-                background-color: @view_bg_color;
-            }
-            .large-entry {
-                min-height: 42px;
-                font-size: 14px;
-            }
-            .message-bubble {
-                border-radius: 18px;
-                padding: 12px 16px;
-                margin: 4px 0;
-            }
-            .user-message {
-                background-color: @accent_color;
-                color: @accent_fg_color;
-            }
-            .ai-message {
-                background-color: @card_bg_color;
-                border: 1px solid @borders;
-            }
-            """
+        if MinimalAIShell._css_installed:
+            return
         
-        css_provider.load_from_data(css_data.encode())
+        # One parsed provider per mode, shared by every window in the process
+        css_provider = MinimalAIShell._css_providers.get(self.desktop_mode)
+        if css_provider is None:
+            css_provider = Gtk.CssProvider()
+            css_provider.load_from_data(_CSS_DESKTOP if self.desktop_mode else _CSS_NORMAL)
+            MinimalAIShell._css_providers[self.desktop_mode] = css_provider
         
         display = Gdk.Display.get_default()
         if display:
             Gtk.StyleContext.add_provider_for_display(
                 display, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
             )
+            MinimalAIShell._css_installed = True
     
     def start_server(self):
         """Start AI server"""
@@ -238,19 +387,25 @@ class MinimalAIShell(Adw.ApplicationWindow):
     
     def launch_server(self):
         """Launch AI server with priority order"""
+        with self.server_lock:
+            if self.server_process or self.server_starting:
+                return
+            self.server_starting = True
+            self.server_launch_id += 1
+            launch_id = self.server_launch_id
+        
         try:
-            if hasattr(self, 'ai_status'):
-                GLib.idle_add(self.ai_status.set_text, "🚀 Starting AI Engine...")
+            GLib.idle_add(self.ai_status.set_text, "🚀 Starting AI Engine...")
             
-            server_path, model_path = self.find_llama_server()
+            server_path, model_path, llamafile_path = _discover_engines(os.getcwd())
             if server_path and model_path:
                 print(f"Using llama.cpp server: {server_path} with model: {model_path}")
                 self.launch_llama_server(server_path, model_path)
                 return
             
-            llamafile_path = self.find_llamafile()
             if llamafile_path:
                 print(f"Trying llamafile: {llamafile_path}")
+                os.chmod(llamafile_path, 0o755)
                 self.launch_llamafile_with_bash(llamafile_path)
                 return
             
@@ -259,86 +414,60 @@ class MinimalAIShell(Adw.ApplicationWindow):
         except Exception as e:
             error_msg = f"AI Engine startup failed: {str(e)}"
             print(error_msg)
-            if hasattr(self, 'ai_status'):
-                GLib.idle_add(self.ai_status.set_text, "❌ Engine Error")
-                GLib.idle_add(self.add_ai_message, f"**Setup Required:**\n{error_msg}")
-    
-    def find_llama_server(self):
-        """Find llama-server and model files"""
-        server_paths = [
-            "./llama.cpp/build/bin/llama-server",
-            "./build/bin/llama-server", 
-            "./llama-server",
-            "llama-server"
-        ]
-        
-        server_path = None
-        for path in server_paths:
-            if os.path.exists(path):
-                server_path = path
-                break
-            elif shutil.which(path.split('/')[-1]):
-                server_path = path.split('/')[-1]
-                break
-        
-        if not server_path:
-            return None, None
-        
-        model_extensions = ['*.gguf', '*.bin']
-        model_path = None
-        
-        for ext in model_extensions:
-            models = list(Path('.').glob(ext))
-            if models:
-                model_path = str(models[0])
-                break
-        
-        return server_path, model_path
-    
-    def find_llamafile(self):
-        """Find llamafile executable"""
-        current_dir = Path(os.getcwd())
-        
-        llamafile_patterns = [
-            "Phi-3-mini-4k-instruct.Q4_0.llamafile",
-            "*.llamafile",
-            "*phi*llamafile*", 
-            "*llamafile*"
-        ]
-        
-        for pattern in llamafile_patterns:
-            if '*' in pattern:
-                files = list(current_dir.glob(pattern))
-                if files:
-                    llamafile_path = files[0]
-                    os.chmod(llamafile_path, 0o755)
-                    return str(llamafile_path.resolve())
-            else:
-                llamafile_path = current_dir / pattern
-                if llamafile_path.exists():
-                    os.chmod(llamafile_path, 0o755)
-                    return str(llamafile_path.resolve())
-        
-        return None
+            GLib.idle_add(self.ai_status.set_text, "❌ Engine Error")
+            GLib.idle_add(self.add_ai_message, f"**Setup Required:**\n{error_msg}")
+        finally:
+            # cleanup_server may have handed the guard to a newer launch meanwhile
+            with self.server_lock:
+                if self.server_launch_id == launch_id:
+                    self.server_starting = False
+    
+    def engine_output(self):
+        """Engine log target: DEVNULL, or the file named by PERSONALAIOS_ENGINE_LOG"""
+        # Never a PIPE: nobody reads it, and a full pipe buffer blocks the server
+        log_path = os.getenv('PERSONALAIOS_ENGINE_LOG')
+        if log_path:
+            try:
+                return open(log_path, 'ab')
+            except OSError as e:
+                print(f"Engine log unavailable: {e}")
+        return subprocess.DEVNULL
     
     def launch_llama_server(self, server_path, model_path):
         """Launch llama.cpp server"""
+        # Prefill is compute-bound: use half the cores (physical cores on SMT hosts)
+        threads = max(2, (os.cpu_count() or 4) // 2)
         cmd = [
             server_path,
             "--model", model_path,
             "--host", "127.0.0.1",
             "--port", "8080",
-            "--ctx-size", "2048",
-            "--threads", "2",
-            "--batch-size", "256",
-            "--ubatch-size", "256",
+            "--ctx-size", "4096",
+            "--threads", str(threads),
+            "--batch-size", "512",
+            "--ubatch-size", "512",
             "--mlock",
             "--no-warmup"
         ]
         
+        # Newer flags are only passed when this build's --help lists them
+        help_text = _server_help(server_path)
+        if "--parallel" in help_text:
+            cmd += ["--parallel", "1"]
+        if "--cont-batching" in help_text:
+            cmd.append("--cont-batching")
+        flash_attn = next((line for line in help_text.splitlines() if "--flash-attn" in line), "")
+        if flash_attn and "auto" not in flash_attn:
+            # Builds taking --flash-attn on|off|auto already default to auto
+            cmd.append("--flash-attn")
+        
+        output = self.engine_output()
         self.server_process = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            cmd, stdout=output, stderr=subprocess.STDOUT
         )
+        if output is not subprocess.DEVNULL:
+            output.close()  # the child holds its own copy
+        self.session_pids.append(self.server_process.pid)
         
         self.wait_for_server("llama.cpp")
     
@@ -351,59 +480,61 @@ class MinimalAIShell(Adw.ApplicationWindow):
             f'"{abs_path}" --server --host 127.0.0.1 --port 8080 --ctx-size 2048 --threads 4 --nobrowser --timeout 300'
         ]
         
+        output = self.engine_output()
         self.server_process = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            cmd, stdout=output, stderr=subprocess.STDOUT,
             cwd=os.path.dirname(abs_path)
         )
+        if output is not subprocess.DEVNULL:
+            output.close()  # the child holds its own copy
+        self.session_pids.append(self.server_process.pid)
         
         self.wait_for_server("llamafile")
     
     def wait_for_server(self, engine_type):
-        """Wait for AI server to become ready"""
-        max_attempts = 120
-        start_time = time.time()
+        """Wait for AI server to become ready, probing /health with exponential backoff"""
+        start_time = time.monotonic()
+        deadline = start_time + 120
+        delay = 0.1
         
-        for attempt in range(max_attempts):
+        while time.monotonic() < deadline:
             try:
-                endpoints = ["/health", "/v1/models", "/", "/v1/chat/completions"]
-                
-                for endpoint in endpoints:
-                    try:
-                        response = requests.get(f"{self.server_url}{endpoint}", timeout=1)
-                        if response.status_code in [200, 404, 405]:
-                            load_time = time.time() - start_time
-                            if hasattr(self, 'ai_status'):
-                                GLib.idle_add(self.ai_status.set_text, "🤖 AI Engine Ready")
-                            
-                            if self.desktop_mode:
-                                GLib.idle_add(self.add_ai_message, 
-                                    f"**🚀 PersonalAIOS Desktop Active**\n\n"
-                                    f"AI-native desktop environment ready.\n"
-                                    f"Engine: {engine_type} • Load time: {load_time:.1f}s\n\n"
-                                    f"**Desktop Controls:**\n"
-                                    f"• Type your queries directly\n"
-                                    f"• Ctrl+L to clear conversation\n" 
-                                    f"• Ctrl+Q to exit session\n"
-                                    f"• Ctrl+R to restart AI engine")
-                            else:
-                                GLib.idle_add(self.add_ai_message, 
-                                    f"**PersonalAIOS Active** 🚀\n\n{engine_type} engine loaded in {load_time:.1f}s")
-                            return
-                    except requests.exceptions.RequestException:
-                        continue
-                        
+                # llama.cpp answers 503 on /health while the model loads
+                response = _SESSION.get(f"{self.server_url}/health", timeout=0.5)
+                if response.status_code in [200, 404, 405]:
+                    load_time = time.monotonic() - start_time
+                    self.server_confirmed = True
+                    self.ready_until = time.monotonic() + self.ready_ttl
+                    GLib.idle_add(self.ai_status.set_text, "🤖 AI Engine Ready")
+                    
+                    if self.desktop_mode:
+                        GLib.idle_add(self.add_ai_message, 
+                            f"**🚀 PersonalAIOS Desktop Active**\n\n"
+                            f"AI-native desktop environment ready.\n"
+                            f"Engine: {engine_type} • Load time: {load_time:.1f}s\n\n"
+                            f"**Desktop Controls:**\n"
+                            f"• Type your queries directly\n"
+                            f"• Ctrl+L to clear conversation\n" 
+                            f"• Ctrl+Q to exit session\n"
+                            f"• Ctrl+R to restart AI engine")
+                    else:
+                        GLib.idle_add(self.add_ai_message, 
+                            f"**PersonalAIOS Active** 🚀\n\n{engine_type} engine loaded in {load_time:.1f}s")
+                    return
+            except requests.exceptions.RequestException:
+                pass
             except Exception as e:
                 print(f"Server check error: {e}")
             
-            elapsed = time.time() - start_time
-            if attempt % 10 == 0:
-                if hasattr(self, 'ai_status'):
-                    GLib.idle_add(self.ai_status.set_text, f"🔄 Loading AI... {elapsed:.0f}s")
-            time.sleep(1)
+            # Only report progress once probes have slowed down
+            if delay >= 1.0:
+                elapsed = time.monotonic() - start_time
+                GLib.idle_add(self.ai_status.set_text, f"🔄 Loading AI... {elapsed:.0f}s")
+            time.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
         
-        if hasattr(self, 'ai_status'):
-            GLib.idle_add(self.ai_status.set_text, "❌ Engine Timeout")
-            GLib.idle_add(self.add_ai_message, "**AI engine failed to start within timeout.**")
+        GLib.idle_add(self.ai_status.set_text, "❌ Engine Timeout")
+        GLib.idle_add(self.add_ai_message, "**AI engine failed to start within timeout.**")
     
     def on_send(self, widget):
         """Handle user input - route through Desktop Manager if available"""
@@ -420,27 +551,42 @@ class MinimalAIShell(Adw.ApplicationWindow):
             if handled:
                 return
         
-        # Not handled by desktop manager - process as AI request
-        if self.is_server_ready():
-            threading.Thread(target=self.get_streaming_response, args=(user_input,), daemon=True).start()
-        else:
-            self.add_ai_message("**AI Engine not ready.** Please wait for initialization.")
+        # Not handled by desktop manager - process as AI request; the worker
+        # checks readiness so the main thread never waits on the network
+        cancel = self.start_streaming_display()
+        threading.Thread(target=self.get_streaming_response, args=(user_input, cancel), daemon=True).start()
     
     def is_server_ready(self):
-        """Check if server is ready"""
+        """Check if server is ready (no network I/O while the cached answer holds)
+        
+        May probe the server for up to a second, so it is only called off the
+        main thread.
+        """
+        if self.server_confirmed or time.monotonic() < self.ready_until:
+            return True
+        
         try:
-            response = requests.get(f"{self.server_url}/v1/models", timeout=0.5)
-            return response.status_code in [200, 404]
+            response = _SESSION.get(f"{self.server_url}/v1/models", timeout=0.5)
+            ready = response.status_code in [200, 404]
         except:
             try:
-                response = requests.get(f"{self.server_url}/", timeout=0.5)
-                return response.status_code in [200, 404, 405]
+                response = _SESSION.get(f"{self.server_url}/", timeout=0.5)
+                ready = response.status_code in [200, 404, 405]
             except:
-                return False
+                ready = False
+        
+        if ready:
+            self.ready_until = time.monotonic() + self.ready_ttl
+        return ready
     
-    def get_streaming_response(self, user_input):
-        """Get streaming AI response"""
+    def get_streaming_response(self, user_input, cancel):
+        """Get streaming AI response (cancel is the Event of the stream it feeds)"""
         try:
+            if not self.is_server_ready():
+                if not cancel.is_set():
+                    GLib.idle_add(self.add_ai_message, "**AI Engine not ready.** Please wait for initialization.")
+                return
+            
             payload = {
                 "messages": [{"role": "user", "content": user_input}],
                 "max_tokens": 512,
@@ -450,65 +596,130 @@ class MinimalAIShell(Adw.ApplicationWindow):
                 "stop": ["\nUser:", "\nHuman:", "User:", "Human:", "\n\n"]
             }
             
-            response = requests.post(
+            with _SESSION.post(
                 f"{self.server_url}/v1/chat/completions",
                 json=payload, stream=True, timeout=self.response_timeout
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"Server error: {response.status_code}")
-            
-            accumulated_response = ""
-            
-            for line in response.iter_lines():
-                if line:
-                    line_text = line.decode('utf-8')
-                    
-                    if line_text.startswith('data: '):
-                        data_text = line_text[6:]
-                        
-                        if data_text.strip() == '[DONE]':
-                            break
+            ) as response:
+                
+                if response.status_code != 200:
+                    raise Exception(f"Server error: {response.status_code}")
+                
+                # Leaving the with block closes the socket, so a cancel also
+                # stops the server generating tokens nobody will see
+                for data in self.iter_sse_data(response, cancel):
+                    try:
+                        chunk_data = _json_loads(data)
                         
-                        try:
-                            chunk_data = json.loads(data_text)
+                        if 'choices' in chunk_data and len(chunk_data['choices']) > 0:
+                            delta = chunk_data['choices'][0].get('delta', {})
+                            content = delta.get('content', '')
                             
-                            if 'choices' in chunk_data and len(chunk_data['choices']) > 0:
-                                delta = chunk_data['choices'][0].get('delta', {})
-                                content = delta.get('content', '')
-                                
-                                if content:
-                                    accumulated_response += content
-                                    GLib.idle_add(self.update_streaming_display, accumulated_response)
-                                
-                        except json.JSONDecodeError:
-                            continue
-            
-            GLib.idle_add(self.finalize_streaming)
+                            if content:
+                                # O(len(content)) per token; joined only when the UI tick renders
+                                with self.stream_lock:
+                                    if cancel.is_set():
+                                        break
+                                    self.stream_chunks.append(content)
+                                    self.stream_dirty = True
+                            
+                    except ValueError:
+                        continue
             
         except Exception as e:
+            if cancel.is_set():
+                return
+            if isinstance(e, requests.exceptions.ConnectionError):
+                # Server went away: make the next send probe again
+                self.server_confirmed = False
+                self.ready_until = 0.0
             error_msg = f"Response failed: {str(e)}"
             GLib.idle_add(self.add_ai_message, f"**Response Error:** {error_msg}")
-    
-    def update_streaming_display(self, partial_response):
-        """Update streaming display"""
+        
+        finally:
+            # A newer stream owns the display once this one was superseded; the
+            # check and the finish happen under the lock that guards the swap
+            with self.stream_lock:
+                if cancel is self.stream_cancel:
+                    self.stream_finished = True
+    
+    @staticmethod
+    def iter_sse_data(response, cancel=None):
+        """Yield raw `data:` payloads from an SSE response until [DONE]
+        
+        Works on the byte stream directly: lines are located with bytes.find and
+        matched in place with pos/endpos, so only the payload itself is copied.
+        """
+        buffer = b""
+        for chunk in response.iter_content(chunk_size=4096):
+            if cancel is not None and cancel.is_set():
+                return
+            buffer += chunk
+            start = 0
+            newline = buffer.find(b"\n")
+            while newline != -1:
+                match = _SSE_DATA_RE.fullmatch(buffer, start, newline)
+                start = newline + 1
+                if match:
+                    data = match.group(1)
+                    if data == b"[DONE]":
+                        return
+                    yield data
+                newline = buffer.find(b"\n", start)
+            buffer = buffer[start:]
+    
+    def start_streaming_display(self):
+        """Reset streaming state and start the UI refresh tick; returns the new stream's cancel Event"""
+        if self.stream_tick_id:
+            GLib.source_remove(self.stream_tick_id)
+        
+        # Abandon any response still streaming; its worker keeps the old Event.
+        # Swapping under the lock means an old worker either finishes before the
+        # reset or sees that it no longer owns the stream
+        with self.stream_lock:
+            self.stream_cancel.set()
+            self.stream_cancel = cancel = threading.Event()
+            self.stream_chunks = []
+            self.stream_dirty = False
+            self.stream_finished = False
+        
+        self.stream_label = None
+        self.stream_tick_id = GLib.timeout_add(self.stream_refresh_ms, self.update_streaming_display)
+        return cancel
+    
+    def update_streaming_display(self):
+        """Render the latest streamed text into a single bubble (runs on the UI tick)"""
+        with self.stream_lock:
+            dirty, finished = self.stream_dirty, self.stream_finished
+            text = "".join(self.stream_chunks) if dirty else ""
+            self.stream_dirty = False
+        
         try:
-            if hasattr(self, 'current_streaming_widget') and self.current_streaming_widget:
-                self.chat_box.remove(self.current_streaming_widget)
-            
-            clean_response = partial_response.strip()
-            if clean_response:
-                self.current_streaming_widget = self.create_message_widget("PersonalAI", clean_response)
-                self.chat_box.append(self.current_streaming_widget)
+            clean_response = text.strip()
+            if dirty and clean_response:
+                if self.stream_label is None:
+                    widget = self.create_message_widget("PersonalAI", clean_response)
+                    # The content label is the bubble's last child; update it in place from now on
+                    self.stream_label = widget.get_last_child()
+                    self.append_bubble(widget)
+                else:
+                    self.stream_label.set_text(clean_response)
                 self.scroll_to_bottom()
                 
         except Exception as e:
             print(f"UI update error: {e}")
+        
+        if finished:
+            self.stream_label = None
+            self.stream_tick_id = None
+            return False
+        return True
     
-    def finalize_streaming(self):
-        """Clean up after streaming"""
-        if hasattr(self, 'current_streaming_widget'):
-            delattr(self, 'current_streaming_widget')
+    def cancel_streaming(self):
+        """Abandon the in-flight response and drop anything not yet rendered"""
+        with self.stream_lock:
+            self.stream_cancel.set()
+            self.stream_chunks = []
+            self.stream_dirty = False
     
     def create_message_widget(self, sender, message, is_user=False):
         """Create message bubble"""
@@ -518,7 +729,11 @@ class MinimalAIShell(Adw.ApplicationWindow):
         sender_label = Gtk.Label(label=sender)
         sender_label.add_css_class("caption-heading")
         
-        time_label = Gtk.Label(label=time.strftime("%H:%M"))
+        minute = int(time.time() // 60)
+        if minute != self.last_minute:
+            self.last_time_str = time.strftime("%H:%M")
+            self.last_minute = minute
+        time_label = Gtk.Label(label=self.last_time_str)
         time_label.add_css_class("caption")
         
         if is_user:
@@ -536,26 +751,21 @@ class MinimalAIShell(Adw.ApplicationWindow):
         content_label.set_selectable(True)
         content_label.set_xalign(0 if not is_user else 1)
         
-        if self.desktop_mode:
-            content_label.set_margin_start(24)
-            content_label.set_margin_end(24)
-            content_label.set_margin_top(16)
-            content_label.set_margin_bottom(16)
-        else:
-            content_label.set_margin_start(16)
-            content_label.set_margin_end(16)
-            content_label.set_margin_top(12)
-            content_label.set_margin_bottom(12)
+        margin_lr, margin_tb, side_margin = self.msg_margins
+        content_label.set_margin_start(margin_lr)
+        content_label.set_margin_end(margin_lr)
+        content_label.set_margin_top(margin_tb)
+        content_label.set_margin_bottom(margin_tb)
         
         content_label.add_css_class("message-bubble")
         if is_user:
             content_label.add_css_class("user-message")
             container.set_halign(Gtk.Align.END)
-            container.set_margin_start(120 if self.desktop_mode else 80)
+            container.set_margin_start(side_margin)
         else:
             content_label.add_css_class("ai-message")
             container.set_halign(Gtk.Align.START)
-            container.set_margin_end(120 if self.desktop_mode else 80)
+            container.set_margin_end(side_margin)
         
         container.append(info_box)
         container.append(content_label)
@@ -564,39 +774,71 @@ class MinimalAIShell(Adw.ApplicationWindow):
     def add_user_message(self, message):
         """Add user message"""
         widget = self.create_message_widget("You", message, is_user=True)
-        self.chat_box.append(widget)
+        self.append_bubble(widget)
         self.scroll_to_bottom()
     
     def add_ai_message(self, message):
         """Add AI message"""
         widget = self.create_message_widget("PersonalAI", message, is_user=False)
-        self.chat_box.append(widget)
+        self.append_bubble(widget)
         self.scroll_to_bottom()
     
+    def append_bubble(self, widget):
+        """Append a message bubble, dropping the oldest once over max_bubbles"""
+        self.chat_box.append(widget)
+        self.bubble_count += 1
+        while self.bubble_count > self.max_bubbles:
+            first = self.chat_box.get_first_child()
+            if first is None:
+                break
+            self.chat_box.remove(first)
+            self.bubble_count -= 1
+    
     def scroll_to_bottom(self):
-        """Auto-scroll to bottom"""
-        def do_scroll():
-            scrolled = self.chat_box.get_parent()
-            if scrolled and isinstance(scrolled, Gtk.ScrolledWindow):
-                vadj = scrolled.get_vadjustment()
-                vadj.set_value(vadj.get_upper() - vadj.get_page_size())
-            return False
-        
-        GLib.idle_add(do_scroll)
+        """Auto-scroll to bottom (bursts of requests collapse into one idle callback)"""
+        if self.scroll_pending:
+            return
+        self.scroll_pending = True
+        GLib.idle_add(self.do_scroll)
+    
+    def do_scroll(self):
+        """Scroll the chat to the bottom; runs once per pending request"""
+        self.scroll_pending = False
+        scrolled = self.chat_box.get_parent()
+        # GTK4 wraps the box in a Viewport inside the ScrolledWindow
+        if isinstance(scrolled, Gtk.Viewport):
+            scrolled = scrolled.get_parent()
+        if scrolled and isinstance(scrolled, Gtk.ScrolledWindow):
+            vadj = scrolled.get_vadjustment()
+            vadj.set_value(vadj.get_upper() - vadj.get_page_size())
+        return False
     
     def clear_chat(self, widget=None):
         """Clear conversation"""
-        child = self.chat_box.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.chat_box.remove(child)
-            child = next_child
+        self.cancel_streaming()
+        
+        # Swap in an empty box instead of removing bubbles one at a time:
+        # one relayout, and the old box drops all its children at once
+        old_box = self.chat_box
+        new_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=old_box.get_spacing())
+        new_box.set_margin_top(old_box.get_margin_top())
+        new_box.set_margin_bottom(old_box.get_margin_bottom())
+        new_box.set_margin_start(old_box.get_margin_start())
+        new_box.set_margin_end(old_box.get_margin_end())
+        
+        # ScrolledWindow wraps the box in a Viewport; both expose set_child
+        old_box.get_parent().set_child(new_box)
+        self.chat_box = new_box
+        self.bubble_count = 0
         
         message = "**Conversation cleared.** Ready for new PersonalAIOS interactions."
         self.add_ai_message(message)
     
     def cleanup(self):
         """Clean shutdown"""
+        self.cancel_streaming()
+        self.server_confirmed = False
+        self.ready_until = 0.0
         if self.server_process:
             try:
                 self.server_process.terminate()
@@ -606,6 +848,15 @@ class MinimalAIShell(Adw.ApplicationWindow):
                 self.server_process.wait()
             except Exception as e:
                 print(f"Cleanup error: {e}")
+            # Reaped: never signal this PID again, it may be reused
+            if self.server_process.pid in self.session_pids:
+                self.session_pids.remove(self.server_process.pid)
+            self.server_process = None
+        # Let a restart launch even while the old launch thread is still waiting;
+        # that thread no longer owns the guard once the launch id moves on
+        with self.server_lock:
+            self.server_launch_id += 1
+            self.server_starting = False
 
 
 class MinimalAIApp(Adw.Application):
@@ -625,6 +876,8 @@ class MinimalAIApp(Adw.Application):
     def do_activate(self):
         if not self.window:
             self.window = MinimalAIShell(application=self)
+            # Model load overlaps with the first frame; launch_server ignores repeat starts
+            self.window.start_server()
         self.window.present()
     
     def do_shutdown(self):
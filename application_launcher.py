@@ -9,15 +9,62 @@ import re
 import json
 import time
 import subprocess
-import shutil
+import shlex
 import os
+import fnmatch
+import atexit
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Set, Tuple, Any, Union
 from dataclasses import dataclass, asdict, field
-import configparser
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import yaml
 
+try:
+    import hyperscan
+    HAVE_HYPERSCAN = True
+except ImportError:
+    HAVE_HYPERSCAN = False
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+_MASK64 = (1 << 64) - 1
+
+if HAVE_NUMPY:
+    _POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+def _popcount64(values):
+    """Per-element popcount of a uint64 array (np.bitwise_count needs NumPy 2.0)"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values).astype(np.int64)
+    return _POPCOUNT8[values.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file (with orjson when available)"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if HAVE_ORJSON else json.loads(data)
+
+def _dump_json(path: Path, data: Any, indent: bool = True):
+    """Write data to a JSON file, indented for hand editing unless indent=False"""
+    if HAVE_ORJSON:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    else:
+        payload = json.dumps(data, indent=2) if indent else json.dumps(data, separators=(',', ':'))
+        payload = payload.encode('utf-8')
+    Path(path).write_bytes(payload)
+
 gi.require_version('Gtk', '4.0')
 from gi.repository import GLib
 
@@ -34,8 +81,108 @@ class SmartApplication:
     usage_count: int = 0
     last_used: float = 0
     is_favorite: bool = False
-    metadata: Dict[str, Any] = field(default_factory=dict)
     confidence_score: float = 1.0
+    # Parsed on first access of `metadata`; searching never needs it
+    _metadata: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    
+    def __post_init__(self):
+        # Lowercase copies for matching, made once; display keeps the original case
+        self.name_lower = self.name.lower()
+        self.description_lower = self.description.lower()
+        self.executable_lower = self.executable.lower()
+        self.keywords_lower = [keyword.lower() for keyword in self.keywords]
+        self.categories_lower = [category.lower() for category in self.categories]
+        self.search_text = f"{self.name_lower} {self.description_lower}"
+        # Filled in by the launcher's _get_app_icon on first use
+        self.icon: Optional[str] = None
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Full desktop-entry metadata, read from desktop_file on first access"""
+        if self._metadata is None:
+            self._metadata = _load_desktop_metadata(self.desktop_file) if self.desktop_file else {}
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]):
+        self._metadata = value
+
+def _parse_semicolon_list(value: str) -> List[str]:
+    """Parse semicolon-separated list"""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(';') if item.strip()]
+
+def _first_keyword_re(keyword_groups: List[Tuple[str, ...]]) -> re.Pattern:
+    """Regex whose match().lastindex is the first group (1-based) with a keyword anywhere in the text
+    
+    Each group is a lookahead from the start, tried in order, so earlier groups
+    win regardless of where in the text their keyword occurs.
+    """
+    return re.compile(r'\A(?:' + '|'.join(
+        '(?=(.*?(?:' + '|'.join(re.escape(keyword) for keyword in keywords) + ')))'
+        for keywords in keyword_groups
+    ) + ')', re.DOTALL)
+
+# The [Desktop Entry] keys the launcher reads; localized and vendor keys are skipped
+_DESKTOP_KEYS = frozenset({
+    'Name', 'Exec', 'Comment', 'Categories', 'Keywords', 'Hidden', 'NoDisplay',
+    'Icon', 'MimeType', 'StartupNotify', 'Version', 'GenericName', 'OnlyShowIn',
+    'NotShowIn', 'TryExec', 'Path', 'Terminal',
+})
+
+def _read_desktop_entry(desktop_file: str, visible_only: bool = False) -> Optional[Dict[str, str]]:
+    """Key/value pairs of the [Desktop Entry] group (None if the file has none)
+    
+    A plain line scan: the format is Key=Value lines under [Group] headers, so
+    configparser's generic section and interpolation machinery is not needed.
+    Later groups such as [Desktop Action ...] and keys outside _DESKTOP_KEYS
+    are not kept. With visible_only, a Hidden=true or NoDisplay=true line
+    stops the read and returns None.
+    """
+    entry = None
+    with open(desktop_file, 'r', encoding='utf-8-sig') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] == '#':
+                continue
+            if line[0] == '[':
+                if entry is not None:
+                    break
+                if line == '[Desktop Entry]':
+                    entry = {}
+                continue
+            if entry is not None:
+                key, sep, value = line.partition('=')
+                key = key.strip()
+                if sep and key in _DESKTOP_KEYS and key not in entry:
+                    value = value.strip()
+                    if visible_only and key in ('Hidden', 'NoDisplay') and value.lower() == 'true':
+                        return None
+                    entry[key] = value
+    return entry
+
+def _load_desktop_metadata(desktop_file: str) -> Dict[str, Any]:
+    """Build the metadata dict for a desktop file ({} if it cannot be read)"""
+    try:
+        entry = _read_desktop_entry(desktop_file)
+    except (OSError, UnicodeDecodeError):
+        return {}
+    if entry is None:
+        return {}
+    
+    return {
+        'icon': entry.get('Icon'),
+        'mime_types': _parse_semicolon_list(entry.get('MimeType', '')),
+        'startup_notify': entry.get('StartupNotify', '').lower() == 'true',
+        'version': entry.get('Version'),
+        'generic_name': entry.get('GenericName'),
+        'only_show_in': _parse_semicolon_list(entry.get('OnlyShowIn', '')),
+        'not_show_in': _parse_semicolon_list(entry.get('NotShowIn', '')),
+        'try_exec': entry.get('TryExec'),
+        'path': entry.get('Path'),
+        'terminal': entry.get('Terminal', '').lower() == 'true'
+    }
 
 class IntelligentApplicationLauncher:
     """
@@ -52,17 +199,124 @@ class IntelligentApplicationLauncher:
     - Full flexibility through configuration files
     """
     
+    # Static regexes, compiled once for every instance
+    _FILLER_WORDS = ['please', 'can you', 'would you', 'could you', 'i want to', 'help me']
+    _FILLER_RE = re.compile(
+        r'\b(?:' + '|'.join(re.escape(filler) for filler in _FILLER_WORDS) + r')\b', re.IGNORECASE
+    )
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _UNIQUE_ID_RE = re.compile(r'[^a-zA-Z0-9_-]')
+    _FIELD_CODE_RE = re.compile(r'%[fFuUdDnNickvm]')
+    
+    # Executable name patterns picked up from PATH, in priority order
+    _COMMAND_PATTERNS = [
+        'firefox*', 'chrome*', 'chromium*',
+        '*terminal*', '*konsole*',
+        'code*', 'atom*', 'gedit*',
+        'nautilus*', 'dolphin*', 'thunar*',
+        '*calculator*', '*calc*',
+        'vlc*', 'mpv*', 'totem*'
+    ]
+    _COMMAND_PATTERN_RES = [re.compile(fnmatch.translate(pattern)) for pattern in _COMMAND_PATTERNS]
+    
+    # Icons by name keyword, then by category keyword, in priority order
+    _NAME_ICONS = (
+        (('firefox',), '🦊'), (('chrome', 'browser'), '🌐'),
+        (('terminal', 'console'), '💻'),
+        (('editor', 'text'), '📝'),
+        (('file', 'folder'), '📁'),
+        (('music', 'audio'), '🎵'),
+        (('video', 'movie'), '🎬'),
+        (('image', 'photo'), '🖼️'),
+        (('game', 'play'), '🎮'),
+        (('calculator', 'calc'), '🧮'),
+        (('mail', 'email'), '📧'),
+        (('settings', 'config'), '⚙️'),
+    )
+    _NAME_ICON_RE = _first_keyword_re([keywords for keywords, _ in _NAME_ICONS])
+    _CATEGORY_ICONS = (
+        (('development', 'programming'), '💻'),
+        (('graphics', 'multimedia'), '🎨'),
+        (('office',), '📄'),
+        (('internet', 'network'), '🌐'),
+        (('game',), '🎮'),
+        (('system', 'utility'), '⚙️'),
+    )
+    _CATEGORY_ICON_RE = _first_keyword_re([keywords for keywords, _ in _CATEGORY_ICONS])
+    
+    # Help texts, built once; only the echoed input varies per response
+    LAUNCH_HELP = """🚀 **Application Launcher Help**
+
+**Launch Applications:**
+• "open [app name]" - Launch any application
+• "start Firefox" - Launch Firefox browser
+• "run terminal" - Open terminal
+
+**Search Applications:**
+• "find video editor" - Search for video editing apps
+• "search games" - Find gaming applications
+
+**List Applications:**
+• "list applications" - Show all installed apps
+• "show my apps" - Display available applications
+
+**Examples:**
+• "open calculator"
+• "launch text editor"
+• "find music player"
+• "list all apps"
+
+**💡 Just say 'open [app name]' to launch any application!**"""
+    _HELP_RESPONSE_TAIL = LAUNCH_HELP + """
+
+**🤖 I learn from your commands - the more you use me, the better I get!**"""
+    
+    # Most recent commands kept in command_history; older ones drop off
+    COMMAND_HISTORY_SIZE = 1000
+    
+    # Resolved launch commands remembered per cleaned input
+    COMMAND_CACHE_SIZE = 256
+    # Bump whenever SmartApplication or discovery output changes shape
+    INDEX_VERSION = 2
+    
+    # Candidate lists remembered per query for incremental (refining) searches
+    SEARCH_CACHE_SIZE = 64
+    
+    # Usage stats are written at most this often; launches only mark them dirty
+    USAGE_FLUSH_DELAY = 5
+    
     def __init__(self):
         """Initialize with complete dynamic discovery"""
         # Dynamic storage
         self.applications: Dict[str, SmartApplication] = {}
         self.app_categories: Dict[str, List[str]] = {}
         self.usage_history: List[Dict] = []
-        self.command_history: List[Dict] = []
+        self.command_history: "deque[Dict]" = deque(maxlen=self.COMMAND_HISTORY_SIZE)
+        self._cmd_cache: "OrderedDict[str, Tuple[str, Dict, str]]" = OrderedDict()
+        self._search_caches: Dict[str, "OrderedDict[str, List[SmartApplication]]"] = {}
+        self._app_positions: Dict[str, int] = {}
+        self._app_name_bits: Dict[str, int] = {}
+        self._name_arrays = None
+        self._trigram_index: Optional[Tuple[List[SmartApplication], Dict[str, Dict[str, Set[int]]]]] = None
+        self._fuzzy_index: Optional[Tuple[List[SmartApplication], Dict[int, List[int]], Dict[str, List[int]]]] = None
+        self._used_app_ids = set()
+        self._path_entries: Optional[List[Dict[str, os.DirEntry]]] = None
+        # Desktop environments of this session, for OnlyShowIn / NotShowIn
+        self._current_desktops = [desktop for desktop in os.environ.get('XDG_CURRENT_DESKTOP', '').split(':') if desktop]
+        self._stats_path = Path.home() / '.personalaios' / 'launcher' / 'usage_stats.json'
+        # Contents of usage_stats.json, read once at startup and kept in step with it
+        self._stats_cache: Dict[str, Dict[str, Any]] = {}
+        # Apps launched since the last usage_stats.json write
+        self._dirty_usage_ids: Set[str] = set()
+        self._usage_lock = threading.Lock()
+        self._usage_flush_scheduled = False
+        atexit.register(self._flush_usage_stats)
         
         # Dynamic configuration - loaded from files or auto-generated
         self.config = self._initialize_dynamic_config()
         self.patterns = self._initialize_dynamic_patterns()
+        self._compiled_patterns = self._compile_patterns(self.patterns)
+        self._intent_database = self._build_intent_database(self._compiled_patterns)
         self.launch_methods = self._discover_launch_methods()
         self.search_paths = self._discover_search_paths()
         
@@ -83,14 +337,9 @@ class IntelligentApplicationLauncher:
         config_dir = Path.home() / '.personalaios' / 'launcher'
         config_dir.mkdir(parents=True, exist_ok=True)
         
-        config_file = config_dir / 'config.yaml'
-        
-        if config_file.exists():
-            try:
-                with open(config_file, 'r') as f:
-                    return yaml.safe_load(f) or {}
-            except:
-                pass
+        config = self._load_state_file('config')
+        if config is not None:
+            return config
         
         # Auto-generate configuration
         config = {
@@ -105,24 +354,15 @@ class IntelligentApplicationLauncher:
         }
         
         # Save auto-generated config
-        try:
-            with open(config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
-        except:
-            pass
+        self._save_state_file('config', config)
         
         return config
     
     def _initialize_dynamic_patterns(self) -> Dict[str, List[str]]:
         """Initialize dynamic natural language patterns"""
-        patterns_file = Path.home() / '.personalaios' / 'launcher' / 'patterns.yaml'
-        
-        if patterns_file.exists():
-            try:
-                with open(patterns_file, 'r') as f:
-                    return yaml.safe_load(f) or {}
-            except:
-                pass
+        patterns = self._load_state_file('patterns')
+        if patterns is not None:
+            return patterns
         
         # Generate base patterns dynamically
         patterns = {
@@ -144,13 +384,78 @@ class IntelligentApplicationLauncher:
         }
         
         # Save patterns for learning
+        self._save_state_file('patterns', patterns)
+        
+        return patterns
+    
+    def _load_state_file(self, name: str) -> Optional[Any]:
+        """Load launcher state `name` from name.json, else a legacy name.yaml
+        
+        Files written by this launcher are JSON; YAML files from older versions (or
+        written by hand) are still read. None if neither exists or parses.
+        """
+        state_dir = Path.home() / '.personalaios' / 'launcher'
+        try:
+            json_file = state_dir / f'{name}.json'
+            if json_file.exists():
+                return _load_json(json_file)
+            yaml_file = state_dir / f'{name}.yaml'
+            if yaml_file.exists():
+                with open(yaml_file, 'r', encoding='utf-8') as f:
+                    return yaml.safe_load(f) or {}
+        except Exception:
+            pass
+        return None
+    
+    def _save_state_file(self, name: str, data: Any):
+        """Write launcher state `name` as name.json"""
         try:
-            with open(patterns_file, 'w') as f:
-                yaml.dump(patterns, f, default_flow_style=False)
-        except:
+            _dump_json(Path.home() / '.personalaios' / 'launcher' / f'{name}.json', data)
+        except Exception:
             pass
+    
+    def _compile_patterns(self, patterns: Dict[str, List[str]]) -> Dict[str, List[re.Pattern]]:
+        """Compile intent patterns once; invalid user patterns are skipped"""
+        compiled = {}
+        for intent, intent_patterns in patterns.items():
+            compiled[intent] = []
+            for pattern in intent_patterns:
+                try:
+                    compiled[intent].append(re.compile(pattern, re.IGNORECASE))
+                except (re.error, TypeError) as e:
+                    if self.config.get('debug_mode', False):
+                        print(f"Debug: Invalid pattern {pattern!r}: {e}")
+        return compiled
+    
+    def _build_intent_database(self, compiled: Dict[str, List[re.Pattern]]):
+        """Compile all intent patterns into one Hyperscan database (None without hyperscan)
         
-        return patterns
+        Pattern ids follow priority order, so the lowest matching id is the one the
+        pattern loop would pick. Returns (database, [(intent, compiled re)]).
+        """
+        if not HAVE_HYPERSCAN:
+            return None
+        
+        patterns = [(intent, pattern) for intent, intent_patterns in compiled.items() for pattern in intent_patterns]
+        if not patterns:
+            return None
+        
+        flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH |
+                 hyperscan.HS_FLAG_ALLOWEMPTY | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[pattern.pattern.encode() for _, pattern in patterns],
+                ids=list(range(len(patterns))),
+                elements=len(patterns),
+                flags=[flags] * len(patterns),
+            )
+        except hyperscan.error as e:
+            # Python-only syntax in a user pattern: stay on the re loop
+            if self.config.get('debug_mode', False):
+                print(f"Debug: Hyperscan compile failed: {e}")
+            return None
+        return database, patterns
     
     def _discover_launch_methods(self) -> List[str]:
         """Dynamically discover available launch methods"""
@@ -166,7 +471,7 @@ class IntelligentApplicationLauncher:
         ]
         
         for command in test_commands:
-            if shutil.which(command):
+            if self._find_in_path(command):
                 methods.append(command)
         
         # Always include direct execution
@@ -174,6 +479,27 @@ class IntelligentApplicationLauncher:
         
         return methods
     
+    def _list_path_dirs(self) -> List[Dict[str, os.DirEntry]]:
+        """Entries of each PATH directory, in PATH order, listed once and reused"""
+        if self._path_entries is None:
+            self._path_entries = []
+            if 'PATH' in os.environ:
+                for path_dir in os.environ['PATH'].split(':'):
+                    try:
+                        with os.scandir(path_dir or '.') as it:
+                            self._path_entries.append({entry.name: entry for entry in it})
+                    except OSError:
+                        continue
+        return self._path_entries
+    
+    def _find_in_path(self, command: str) -> Optional[str]:
+        """shutil.which() over the cached PATH listing"""
+        for entries in self._list_path_dirs():
+            entry = entries.get(command)
+            if entry is not None and entry.is_file() and os.access(entry.path, os.X_OK):
+                return entry.path
+        return None
+    
     def _discover_search_paths(self) -> List[str]:
         """Dynamically discover application search paths"""
         paths = []
@@ -210,14 +536,9 @@ class IntelligentApplicationLauncher:
     
     def _load_or_create_preferences(self) -> Dict[str, Any]:
         """Load or create user preferences dynamically"""
-        prefs_file = Path.home() / '.personalaios' / 'launcher' / 'preferences.yaml'
-        
-        if prefs_file.exists():
-            try:
-                with open(prefs_file, 'r') as f:
-                    return yaml.safe_load(f) or {}
-            except:
-                pass
+        preferences = self._load_state_file('preferences')
+        if preferences is not None:
+            return preferences
         
         # Generate default preferences
         preferences = {
@@ -233,24 +554,20 @@ class IntelligentApplicationLauncher:
         }
         
         # Save preferences
-        try:
-            with open(prefs_file, 'w') as f:
-                yaml.dump(preferences, f, default_flow_style=False)
-        except:
-            pass
+        self._save_state_file('preferences', preferences)
         
         return preferences
     
     def _discover_everything_dynamically(self):
         """Discover all applications and system info dynamically"""
         print("🔍 Dynamic discovery starting...")
+        self._cmd_cache.clear()
         
-        # Discover applications from all paths
-        for path in self.search_paths:
-            self._scan_path_dynamically(Path(path))
-        
-        # Discover system commands
-        self._discover_system_commands()
+        # Reuse the saved index while no scanned directory has changed
+        mtimes = self._index_mtimes()
+        if not self._load_app_index(mtimes):
+            self._scan_applications()
+            self._save_app_index(mtimes)
         
         # Generate categories dynamically
         self._generate_dynamic_categories()
@@ -258,43 +575,133 @@ class IntelligentApplicationLauncher:
         # Load usage history
         self._load_usage_history()
         
+        self._reset_search_state()
+        
         print("✅ Dynamic discovery complete")
     
-    def _scan_path_dynamically(self, path: Path):
-        """Scan path for applications with zero hardcoding"""
-        if not path.exists():
-            return
-        
-        try:
-            # Scan for .desktop files
-            for desktop_file in path.glob('*.desktop'):
-                app = self._parse_desktop_file(desktop_file)
+    def _scan_applications(self):
+        """Scan search paths and PATH for applications"""
+        # Discover applications from all paths: list them first, then parse every
+        # .desktop file on a thread pool (small-file reads release the GIL)
+        listings = [self._scan_path_dynamically(Path(path)) for path in self.search_paths]
+        desktop_files = [desktop_file for files, _ in listings for desktop_file in files]
+        parsed = iter(())
+        if desktop_files:
+            workers = min(8, (os.cpu_count() or 1) * 2, len(desktop_files))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                parsed = iter(list(pool.map(self._parse_desktop_file, desktop_files)))
+        
+        # Merge on this thread in scan order, so ids stay stable and no locking is needed
+        for files, executables in listings:
+            for _ in files:
+                app = next(parsed)
                 if app:
+                    app.id = self._generate_unique_id(app.name)
                     self.applications[app.id] = app
             
-            # Scan for executable files (in bin directories)
-            if 'bin' in str(path).lower():
-                for executable in path.iterdir():
-                    if executable.is_file() and os.access(executable, os.X_OK):
-                        app = self._create_app_from_executable(executable)
-                        if app:
-                            self.applications[app.id] = app
+            for executable in executables:
+                app = self._create_app_from_executable(Path(executable))
+                if app:
+                    self.applications[app.id] = app
+        
+        # Discover system commands
+        self._discover_system_commands()
+    
+    def _index_file(self) -> Path:
+        """Location of the persisted application index"""
+        return Path.home() / '.personalaios' / 'launcher' / 'app_index.json'
+    
+    def _index_mtimes(self) -> Dict[str, Optional[int]]:
+        """mtimes of every scanned directory; adding or removing an entry changes them"""
+        directories = list(self.search_paths)
+        if 'PATH' in os.environ:
+            directories += os.environ['PATH'].split(':')
+        
+        mtimes = {}
+        for directory in directories:
+            try:
+                mtimes[directory] = os.stat(directory or '.').st_mtime_ns
+            except OSError:
+                mtimes[directory] = None
+        return mtimes
+    
+    def _load_app_index(self, mtimes: Dict[str, Optional[int]]) -> bool:
+        """Load applications from the saved index if it is still valid"""
+        try:
+            index = _load_json(self._index_file())
+            
+            if index.get('version') != self.INDEX_VERSION or index.get('mtimes') != mtimes:
+                return False
+            if index.get('desktops') != self._current_desktops:
+                return False
+            # Edits inside a .desktop file do not touch the directory mtime
+            if time.time() - index.get('saved_at', 0) > self.config.get('cache_duration', 3600):
+                return False
+            
+            apps = {app_id: SmartApplication(**data) for app_id, data in index['apps'].items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return False
+        
+        self.applications.update(apps)
+        return True
+    
+    def _save_app_index(self, mtimes: Dict[str, Optional[int]]):
+        """Persist the scanned applications for the next startup"""
+        try:
+            index_file = self._index_file()
+            index = {
+                'version': self.INDEX_VERSION,
+                'saved_at': time.time(),
+                'mtimes': mtimes,
+                'desktops': self._current_desktops,
+                'apps': {app_id: asdict(app) for app_id, app in self.applications.items()}
+            }
+            
+            # Write then rename, so a crash never leaves a truncated index
+            tmp_file = index_file.with_suffix('.tmp')
+            _dump_json(tmp_file, index, indent=False)
+            os.replace(tmp_file, index_file)
+            
+        except Exception as e:
+            if self.config.get('debug_mode', False):
+                print(f"Debug: Save index error: {e}")
+    
+    def _scan_path_dynamically(self, path: Path) -> Tuple[List[str], List[str]]:
+        """List a path's .desktop files and (in bin directories) executables"""
+        desktop_files = []
+        executables = []
+        if not path.exists():
+            return desktop_files, executables
+        
+        try:
+            # One scandir pass; DirEntry caches the type so most entries need no stat
+            scan_bin = 'bin' in str(path).lower()
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.desktop'):
+                        desktop_files.append(entry.path)
+                    if scan_bin and entry.is_file() and os.access(entry.path, os.X_OK):
+                        executables.append(entry.path)
         
         except Exception as e:
             if self.config.get('debug_mode', False):
                 print(f"Debug: Scan error for {path}: {e}")
+        
+        return desktop_files, executables
     
-    def _parse_desktop_file(self, desktop_file: Path) -> Optional[SmartApplication]:
-        """Parse desktop file with complete flexibility"""
+    def _parse_desktop_file(self, desktop_file: Union[str, Path]) -> Optional[SmartApplication]:
+        """Parse desktop file with complete flexibility
+        
+        Thread-safe: touches no shared state, so the returned app has no id yet;
+        the caller assigns one when merging it into self.applications.
+        """
+        desktop_file = Path(desktop_file)
         try:
-            parser = configparser.ConfigParser(interpolation=None)
-            parser.read(str(desktop_file), encoding='utf-8')
+            entry = _read_desktop_entry(str(desktop_file), visible_only=True)
             
-            if 'Desktop Entry' not in parser:
+            if entry is None:
                 return None
             
-            entry = parser['Desktop Entry']
-            
             # Dynamic field extraction
             name = entry.get('Name', desktop_file.stem)
             executable = entry.get('Exec', '')
@@ -302,33 +709,20 @@ class IntelligentApplicationLauncher:
             if not name or not executable:
                 return None
             
-            # Skip hidden entries
-            if entry.get('Hidden', '').lower() == 'true':
-                return None
-            if entry.get('NoDisplay', '').lower() == 'true':
+            # Hidden / NoDisplay entries were already dropped while reading; also
+            # skip entries this session's desktop would not show
+            if self._current_desktops and not self._shown_in_current_desktop(entry):
                 return None
             
-            # Extract all available metadata dynamically
+            # Only what search needs; the rest loads lazily via app.metadata
             app = SmartApplication(
-                id=self._generate_unique_id(name),
+                id='',
                 name=name,
                 description=entry.get('Comment', ''),
                 executable=executable,
                 categories=self._parse_semicolon_list(entry.get('Categories', '')),
                 keywords=self._parse_semicolon_list(entry.get('Keywords', '')),
-                desktop_file=str(desktop_file),
-                metadata={
-                    'icon': entry.get('Icon'),
-                    'mime_types': self._parse_semicolon_list(entry.get('MimeType', '')),
-                    'startup_notify': entry.get('StartupNotify', '').lower() == 'true',
-                    'version': entry.get('Version'),
-                    'generic_name': entry.get('GenericName'),
-                    'only_show_in': self._parse_semicolon_list(entry.get('OnlyShowIn', '')),
-                    'not_show_in': self._parse_semicolon_list(entry.get('NotShowIn', '')),
-                    'try_exec': entry.get('TryExec'),
-                    'path': entry.get('Path'),
-                    'terminal': entry.get('Terminal', '').lower() == 'true'
-                }
+                desktop_file=str(desktop_file)
             )
             
             return app
@@ -338,6 +732,14 @@ class IntelligentApplicationLauncher:
                 print(f"Debug: Parse error for {desktop_file}: {e}")
             return None
     
+    def _shown_in_current_desktop(self, entry: Dict[str, str]) -> bool:
+        """Apply an entry's OnlyShowIn / NotShowIn lists to XDG_CURRENT_DESKTOP"""
+        only_show_in = self._parse_semicolon_list(entry.get('OnlyShowIn', ''))
+        if only_show_in and not any(desktop in only_show_in for desktop in self._current_desktops):
+            return False
+        not_show_in = self._parse_semicolon_list(entry.get('NotShowIn', ''))
+        return not any(desktop in not_show_in for desktop in self._current_desktops)
+    
     def _create_app_from_executable(self, executable: Path) -> Optional[SmartApplication]:
         """Create application from executable file"""
         try:
@@ -347,12 +749,12 @@ class IntelligentApplicationLauncher:
                 description=f"Executable program: {executable.name}",
                 executable=str(executable),
                 categories=['System', 'Utility'],
-                keywords=[executable.name, executable.stem],
-                metadata={
-                    'source': 'executable_scan',
-                    'path': str(executable.parent)
-                }
+                keywords=[executable.name, executable.stem]
             )
+            app.metadata = {
+                'source': 'executable_scan',
+                'path': str(executable.parent)
+            }
             return app
         except Exception as e:
             if self.config.get('debug_mode', False):
@@ -361,30 +763,18 @@ class IntelligentApplicationLauncher:
     
     def _discover_system_commands(self):
         """Dynamically discover common system commands"""
-        # Common command patterns to look for
-        common_patterns = [
-            'firefox*', 'chrome*', 'chromium*',
-            '*terminal*', '*konsole*',
-            'code*', 'atom*', 'gedit*',
-            'nautilus*', 'dolphin*', 'thunar*',
-            '*calculator*', '*calc*',
-            'vlc*', 'mpv*', 'totem*'
-        ]
-        
-        # Search in PATH
-        if 'PATH' in os.environ:
-            for path_dir in os.environ['PATH'].split(':'):
-                path_obj = Path(path_dir)
-                if path_obj.exists():
-                    for pattern in common_patterns:
-                        for executable in path_obj.glob(pattern):
-                            if executable.is_file() and os.access(executable, os.X_OK):
-                                app_id = self._generate_unique_id(executable.name)
-                                if app_id not in self.applications:
-                                    app = self._create_app_from_executable(executable)
-                                    if app:
-                                        app.metadata['source'] = 'system_command_scan'
-                                        self.applications[app_id] = app
+        # Search in PATH, reusing the listing made for launch-method discovery
+        for entries in self._list_path_dirs():
+            for pattern in self._COMMAND_PATTERN_RES:
+                for entry in entries.values():
+                    if pattern.match(entry.name) and entry.is_file() and os.access(entry.path, os.X_OK):
+                        executable = Path(entry.path)
+                        app_id = self._generate_unique_id(executable.name)
+                        if app_id not in self.applications:
+                            app = self._create_app_from_executable(executable)
+                            if app:
+                                app.metadata['source'] = 'system_command_scan'
+                                self.applications[app_id] = app
     
     def _generate_dynamic_categories(self):
         """Generate categories dynamically based on discovered applications"""
@@ -392,24 +782,37 @@ class IntelligentApplicationLauncher:
         
         # Auto-generate categories from desktop file categories
         for app in self.applications.values():
-            for category in app.categories:
-                if category:
-                    category_key = category.lower()
+            for category_key in app.categories_lower:
+                if category_key:
                     if category_key not in self.app_categories:
                         self.app_categories[category_key] = []
                     self.app_categories[category_key].append(app.id)
         
         # Generate semantic categories from app names and descriptions
         semantic_categories = self._generate_semantic_categories()
+        categories_by_keyword = {}
         for category, keywords in semantic_categories.items():
             if category not in self.app_categories:
                 self.app_categories[category] = []
-            
-            for app in self.applications.values():
-                app_text = f"{app.name} {app.description}".lower()
-                if any(keyword in app_text for keyword in keywords):
-                    if app.id not in self.app_categories[category]:
-                        self.app_categories[category].append(app.id)
+            for keyword in keywords:
+                categories_by_keyword.setdefault(keyword, []).append(category)
+        if not categories_by_keyword:
+            return
+        
+        # Keywords are single words, so any occurrence in an app's text lies inside
+        # one of its whitespace-separated tokens: walk each app's tokens once and
+        # look their substrings up, instead of testing every keyword against every app
+        min_len = min(len(keyword) for keyword in categories_by_keyword)
+        max_len = max(len(keyword) for keyword in categories_by_keyword)
+        for app in self.applications.values():
+            matched = set()
+            for token in set(app.search_text.split()):
+                for start in range(len(token) - min_len + 1):
+                    for end in range(start + min_len, min(start + max_len, len(token)) + 1):
+                        matched.update(categories_by_keyword.get(token[start:end], ()))
+            for category in matched:
+                if category not in app.categories_lower:  # already listed from desktop categories
+                    self.app_categories[category].append(app.id)
     
     def _generate_semantic_categories(self) -> Dict[str, List[str]]:
         """Generate semantic categories from discovered applications"""
@@ -418,8 +821,8 @@ class IntelligentApplicationLauncher:
         # Analyze all app names and descriptions to find common themes
         all_text = []
         for app in self.applications.values():
-            all_text.extend(app.name.lower().split())
-            all_text.extend(app.description.lower().split())
+            all_text.extend(app.name_lower.split())
+            all_text.extend(app.description_lower.split())
         
         # Find common keywords
         word_freq = {}
@@ -434,15 +837,109 @@ class IntelligentApplicationLauncher:
         
         return categories
     
+    def _reset_search_state(self):
+        """Drop cached candidate lists; call whenever self.applications changes"""
+        self._search_caches.clear()
+        self._app_positions = {app_id: i for i, app_id in enumerate(self.applications)}
+        self._app_name_bits = {app_id: self._char_bits(app.name_lower)
+                               for app_id, app in self.applications.items()}
+        self._name_arrays = None
+        self._trigram_index = None
+        self._fuzzy_index = None
+    
+    def _build_trigram_index(self) -> Tuple[List[SmartApplication], Dict[str, Dict[str, Set[int]]]]:
+        """Map every 3-character substring of app names / keywords to app positions"""
+        apps = list(self.applications.values())
+        index = {'name': {}, 'keyword': {}}
+        for position, app in enumerate(apps):
+            fields = {'name': [app.name_lower], 'keyword': app.keywords_lower}
+            for kind, texts in fields.items():
+                postings = index[kind]
+                for text in texts:
+                    for i in range(len(text) - 2):
+                        postings.setdefault(text[i:i + 3], set()).add(position)
+        return apps, index
+    
+    def _indexed_filter(self, kind: str, query_lower: str, matches) -> List[SmartApplication]:
+        """Apps (in discovery order) whose `kind` field contains query_lower
+        
+        A substring hit must contain every trigram of the query, so intersecting
+        the trigram postings gives a small superset that `matches` then confirms.
+        Queries shorter than a trigram use the cached linear filter instead.
+        """
+        if len(query_lower) < 3:
+            return self._cached_filter(kind, query_lower, matches)
+        
+        if self._trigram_index is None:
+            self._trigram_index = self._build_trigram_index()
+        apps, index = self._trigram_index
+        postings = index[kind]
+        
+        candidates = None
+        for i in range(len(query_lower) - 2):
+            positions = postings.get(query_lower[i:i + 3])
+            if not positions:
+                return []
+            candidates = set(positions) if candidates is None else candidates & positions
+            if not candidates:
+                return []
+        
+        return [apps[i] for i in sorted(candidates) if matches(apps[i], query_lower)]
+    
+    def _cached_filter(self, kind: str, query_lower: str, matches) -> List[SmartApplication]:
+        """Apps (in discovery order) for which matches(app, query_lower) holds
+        
+        All `matches` predicates are substring tests, so anything matching a query
+        also matches every substring of it: the hit list of the longest cached
+        substring query is a complete candidate pool for a refined query.
+        """
+        cache = self._search_caches.setdefault(kind, OrderedDict())
+        hits = cache.get(query_lower)
+        if hits is not None:
+            cache.move_to_end(query_lower)
+            return hits
+        
+        pool = self.applications.values()
+        best_key = ''
+        for key in cache:
+            if len(key) > len(best_key) and key in query_lower:
+                best_key = key
+        if best_key:
+            cache.move_to_end(best_key)
+            pool = cache[best_key]
+        
+        hits = [app for app in pool if matches(app, query_lower)]
+        
+        # Only lists that actually narrow the search are worth keeping
+        if len(hits) < 0.5 * len(self.applications):
+            cache[query_lower] = hits
+            if len(cache) > self.SEARCH_CACHE_SIZE:
+                cache.popitem(last=False)
+        return hits
+    
+    @staticmethod
+    def _name_matches(app: SmartApplication, query_lower: str) -> bool:
+        return query_lower in app.name_lower
+    
+    @staticmethod
+    def _keyword_matches(app: SmartApplication, query_lower: str) -> bool:
+        return any(query_lower in keyword for keyword in app.keywords_lower)
+    
+    @staticmethod
+    def _text_matches(app: SmartApplication, query_lower: str) -> bool:
+        return (query_lower in app.name_lower or
+                query_lower in app.description_lower or
+                any(query_lower in keyword for keyword in app.keywords_lower) or
+                any(query_lower in cat for cat in app.categories_lower) or
+                query_lower in app.executable_lower)
+    
     def _parse_semicolon_list(self, value: str) -> List[str]:
         """Parse semicolon-separated list"""
-        if not value:
-            return []
-        return [item.strip() for item in value.split(';') if item.strip()]
+        return _parse_semicolon_list(value)
     
     def _generate_unique_id(self, name: str) -> str:
         """Generate unique ID for application"""
-        base_id = re.sub(r'[^a-zA-Z0-9_-]', '_', name.lower())
+        base_id = self._UNIQUE_ID_RE.sub('_', name.lower())
         
         counter = 1
         unique_id = base_id
@@ -457,6 +954,18 @@ class IntelligentApplicationLauncher:
         # Preprocess input
         cleaned_input = self._preprocess_input(user_input)
         
+        # Repeat command: reuse the resolved app, skip intent and fuzzy matching
+        cached = self._cmd_cache.get(cleaned_input)
+        if cached is not None:
+            intent, entities, app_id = cached
+            app = self.applications.get(app_id)
+            if app is not None:
+                self._cmd_cache.move_to_end(cleaned_input)
+                if self.user_preferences.get('learning_enabled', True):
+                    self._log_command(user_input, intent, entities)
+                return self._launch_application(app)
+            del self._cmd_cache[cleaned_input]
+        
         # Dynamic intent extraction
         intent, entities = self._extract_intent_dynamically(cleaned_input)
         
@@ -480,24 +989,24 @@ class IntelligentApplicationLauncher:
     
     def _preprocess_input(self, text: str) -> str:
         """Preprocess input text"""
-        # Remove common filler words dynamically
-        filler_words = ['please', 'can you', 'would you', 'could you', 'i want to', 'help me']
+        # Remove common filler words in a single pass
+        text = self._FILLER_RE.sub('', text)
         
-        for filler in filler_words:
-            text = re.sub(f'\\b{re.escape(filler)}\\b', '', text, flags=re.IGNORECASE)
-        
-        return re.sub(r'\s+', ' ', text).strip().lower()
+        return self._WHITESPACE_RE.sub(' ', text).strip().lower()
     
     def _extract_intent_dynamically(self, text: str) -> Tuple[Optional[str], Dict]:
         """Extract intent using dynamic patterns"""
-        for intent, patterns in self.patterns.items():
+        if self._intent_database is not None:
+            return self._extract_intent_hyperscan(text)
+        
+        for intent, patterns in self._compiled_patterns.items():
             for pattern in patterns:
                 try:
-                    match = re.search(pattern, text, re.IGNORECASE)
+                    match = pattern.search(text)
                     if match:
                         entities = {
                             'target': match.group(1) if match.groups() else None,
-                            'confidence': self._calculate_match_confidence(text, pattern),
+                            'confidence': self._calculate_match_confidence(text, pattern.pattern),
                             'original_text': text
                         }
                         return intent, entities
@@ -506,6 +1015,36 @@ class IntelligentApplicationLauncher:
         
         return None, {}
     
+    def _extract_intent_hyperscan(self, text: str) -> Tuple[Optional[str], Dict]:
+        """Find the winning pattern with one Hyperscan pass, then capture with its regex"""
+        database, patterns = self._intent_database
+        matched_ids = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            matched_ids.append(pattern_id)
+            # Pattern 0 has top priority, nothing can beat it
+            return pattern_id == 0
+        
+        try:
+            database.scan(text.encode(), match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass
+        if not matched_ids:
+            return None, {}
+        
+        # Hyperscan only reports which pattern matched, captures come from re
+        intent, pattern = patterns[min(matched_ids)]
+        match = pattern.search(text)
+        if not match:
+            return None, {}
+        
+        entities = {
+            'target': match.group(1) if match.groups() else None,
+            'confidence': self._calculate_match_confidence(text, pattern.pattern),
+            'original_text': text
+        }
+        return intent, entities
+    
     def _calculate_match_confidence(self, text: str, pattern: str) -> float:
         """Calculate confidence score for pattern match"""
         # Simple confidence based on pattern specificity
@@ -528,6 +1067,7 @@ class IntelligentApplicationLauncher:
         app = self._find_app_fuzzy(target)
         
         if app:
+            self._remember_command('launch', entities, app)
             return self._launch_application(app)
         else:
             suggestions = self._find_similar_apps(target)
@@ -535,6 +1075,16 @@ class IntelligentApplicationLauncher:
                 return self._format_suggestions(target, suggestions)
             return f"🔍 **Application not found:** '{target}'\n\nTry 'list applications' to see what's available."
     
+    def _remember_command(self, intent: str, entities: Dict, app: SmartApplication):
+        """Cache a resolved command under its cleaned input (LRU bounded)"""
+        key = entities.get('original_text')
+        if not key:
+            return
+        self._cmd_cache[key] = (intent, entities, app.id)
+        self._cmd_cache.move_to_end(key)
+        if len(self._cmd_cache) > self.COMMAND_CACHE_SIZE:
+            self._cmd_cache.popitem(last=False)
+    
     def _handle_search(self, entities: Dict) -> str:
         """Handle application search"""
         query = entities.get('target', '').strip()
@@ -558,9 +1108,9 @@ class IntelligentApplicationLauncher:
         
         # Sort by usage and favorites
         if self.user_preferences.get('sort_by_usage', True):
-            apps.sort(key=lambda x: (-x.usage_count, x.name.lower()))
+            apps.sort(key=lambda x: (-x.usage_count, x.name_lower))
         else:
-            apps.sort(key=lambda x: x.name.lower())
+            apps.sort(key=lambda x: x.name_lower)
         
         return self._format_app_list(apps)
     
@@ -568,62 +1118,172 @@ class IntelligentApplicationLauncher:
         """Find application using fuzzy matching"""
         query_lower = query.lower().strip()
         
+        # Exact matches are also partial matches, so both come from one candidate list
+        name_hits = self._indexed_filter('name', query_lower, self._name_matches)
+        
         # Exact name match
-        for app in self.applications.values():
-            if app.name.lower() == query_lower:
+        for app in name_hits:
+            if app.name_lower == query_lower:
                 return app
         
         # Partial name match
-        for app in self.applications.values():
-            if query_lower in app.name.lower():
-                return app
+        if name_hits:
+            return name_hits[0]
         
         # Keywords match
-        for app in self.applications.values():
-            if any(query_lower in keyword.lower() for keyword in app.keywords):
-                return app
+        keyword_hits = self._indexed_filter('keyword', query_lower, self._keyword_matches)
+        if keyword_hits:
+            return keyword_hits[0]
         
         # Fuzzy matching
         best_app = None
         best_score = 0
         threshold = self.config.get('fuzzy_matching_threshold', 0.6)
         
-        for app in self.applications.values():
-            score = self._calculate_similarity(query_lower, app.name.lower())
+        query_bits = self._char_bits(query_lower)
+        scores = self._similarity_scores(query_lower, query_bits)
+        if scores is not None:
+            apps = self._name_arrays[0]
+            if not apps:
+                return None
+            best = int(np.argmax(scores))  # first of equal maxima, like the loop
+            if scores[best] > 0 and scores[best] >= threshold:
+                return apps[best]
+            return None
+        
+        name_bits = self._app_name_bits
+        for app in self._fuzzy_candidates(query_lower, query_bits, threshold):
+            score = self._calculate_similarity(query_lower, app.name_lower,
+                                               query_bits, name_bits.get(app.id))
             if score > best_score and score >= threshold:
                 best_score = score
                 best_app = app
+                if score >= 1.0:  # nothing later can beat it
+                    break
         
         return best_app
     
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """Calculate string similarity"""
+    def _fuzzy_candidates(self, query_lower: str, query_bits: int, threshold: float) -> List[SmartApplication]:
+        """Apps (in discovery order) that can reach threshold in the fuzzy stage
+        
+        The fuzzy stage runs only when no name contains the query, so a name scores
+        0.8 only if it is a substring of the query, else the character-set Jaccard,
+        which is at most min(|A|, |B|) / max(|A|, |B|) of the set sizes. Names are
+        bucketed by size, so only buckets within threshold are scored.
+        """
+        if self._fuzzy_index is None:
+            apps = list(self.applications.values())
+            buckets, names = {}, {}
+            for position, app in enumerate(apps):
+                size = self._app_name_bits.get(app.id, self._char_bits(app.name_lower)).bit_count()
+                buckets.setdefault(size, []).append(position)
+                names.setdefault(app.name_lower, []).append(position)
+            self._fuzzy_index = (apps, buckets, names)
+        apps, buckets, names = self._fuzzy_index
+        
+        if threshold <= 0:
+            return apps
+        
+        size = query_bits.bit_count()
+        low, high = int(size * threshold), int(size / threshold) + 1
+        positions = [position for bucket_size, bucket in buckets.items()
+                     if low <= bucket_size <= high for position in bucket]
+        for start in range(len(query_lower)):
+            for end in range(start + 1, len(query_lower) + 1):
+                positions.extend(names.get(query_lower[start:end], ()))
+        return [apps[position] for position in sorted(set(positions))]
+    
+    def _calculate_similarity(self, str1: str, str2: str,
+                              bits1: Optional[int] = None, bits2: Optional[int] = None) -> float:
+        """Calculate string similarity (pass precomputed _char_bits to skip recomputing them)"""
         if str1 == str2:
             return 1.0
         
         if str1 in str2 or str2 in str1:
             return 0.8
         
-        # Simple character-based similarity
-        set1, set2 = set(str1), set(str2)
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
+        # Character-set Jaccard as popcounts on bitsets, no per-call set objects
+        if bits1 is None:
+            bits1 = self._char_bits(str1)
+        if bits2 is None:
+            bits2 = self._char_bits(str2)
+        union = (bits1 | bits2).bit_count()
+        
+        return (bits1 & bits2).bit_count() / union if union > 0 else 0.0
+    
+    def _similarity_scores(self, query_lower: str, query_bits: int):
+        """_calculate_similarity against every app name at once (None without NumPy)
         
-        return intersection / union if union > 0 else 0.0
+        Name bitsets live in two uint64 arrays (code points below 128); the rare
+        names outside ASCII are scored one by one.
+        """
+        if not HAVE_NUMPY or query_bits >> 128:
+            return None
+        
+        if self._name_arrays is None:
+            apps = list(self.applications.values())
+            bits = [self._app_name_bits.get(app.id, self._char_bits(app.name_lower)) for app in apps]
+            self._name_arrays = (
+                apps,
+                np.array([b & _MASK64 for b in bits], dtype=np.uint64),
+                np.array([(b >> 64) & _MASK64 for b in bits], dtype=np.uint64),
+                np.flatnonzero([b >> 128 != 0 for b in bits]),
+            )
+        apps, lo, hi, wide = self._name_arrays
+        
+        q_lo = np.uint64(query_bits & _MASK64)
+        q_hi = np.uint64(query_bits >> 64)
+        inter = _popcount64(lo & q_lo) + _popcount64(hi & q_hi)
+        union = _popcount64(lo | q_lo) + _popcount64(hi | q_hi)
+        scores = inter / np.maximum(union, 1)
+        
+        # Equal/substring names score 1.0/0.8; only names whose character set is a
+        # subset or superset of the query's can be one, so just those are compared
+        subset = ((lo & ~q_lo) | (hi & ~q_hi)) == 0
+        superset = ((q_lo & ~lo) | (q_hi & ~hi)) == 0
+        for i in np.flatnonzero(subset | superset):
+            name = apps[i].name_lower
+            if name == query_lower:
+                scores[i] = 1.0
+            elif name in query_lower or query_lower in name:
+                scores[i] = 0.8
+        
+        for i in wide:
+            scores[i] = self._calculate_similarity(query_lower, apps[i].name_lower)
+        return scores
+    
+    @staticmethod
+    def _char_bits(text: str) -> int:
+        """Bitset of the distinct characters in text (bit n set for chr(n))"""
+        bits = 0
+        for ch in text:
+            bits |= 1 << ord(ch)
+        return bits
     
     def _find_similar_apps(self, query: str) -> List[SmartApplication]:
         """Find similar applications for suggestions"""
         suggestions = []
         query_lower = query.lower()
+        query_bits = self._char_bits(query_lower)
+        max_suggestions = self.config.get('max_suggestions', 10)
         
+        scores = self._similarity_scores(query_lower, query_bits)
+        if scores is not None:
+            apps = self._name_arrays[0]
+            hits = np.flatnonzero(scores > 0.3)
+            # Stable sort keeps discovery order among equal scores
+            hits = hits[np.argsort(-scores[hits], kind='stable')]
+            return [apps[i] for i in hits[:max_suggestions]]
+        
+        name_bits = self._app_name_bits
         for app in self.applications.values():
-            score = self._calculate_similarity(query_lower, app.name.lower())
+            score = self._calculate_similarity(query_lower, app.name_lower,
+                                               query_bits, name_bits.get(app.id))
             if score > 0.3:  # Lower threshold for suggestions
                 suggestions.append((app, score))
         
         # Sort by similarity score
         suggestions.sort(key=lambda x: x[1], reverse=True)
-        max_suggestions = self.config.get('max_suggestions', 10)
         return [app for app, score in suggestions[:max_suggestions]]
     
     def _search_applications(self, query: str) -> List[SmartApplication]:
@@ -631,27 +1291,33 @@ class IntelligentApplicationLauncher:
         results = []
         query_lower = query.lower()
         
-        for app in self.applications.values():
+        # Only text hits can score on content; used apps still get their usage boost
+        candidates = self._cached_filter('search', query_lower, self._text_matches)
+        candidate_ids = {app.id for app in candidates}
+        extra = [self.applications[app_id] for app_id in self._used_app_ids
+                 if app_id not in candidate_ids and app_id in self.applications]
+        
+        for app in candidates + extra:
             score = 0
             
             # Name matching
-            if query_lower in app.name.lower():
+            if query_lower in app.name_lower:
                 score += 10
             
             # Description matching
-            if query_lower in app.description.lower():
+            if query_lower in app.description_lower:
                 score += 5
             
             # Keywords matching
-            if any(query_lower in keyword.lower() for keyword in app.keywords):
+            if any(query_lower in keyword for keyword in app.keywords_lower):
                 score += 8
             
             # Category matching
-            if any(query_lower in cat.lower() for cat in app.categories):
+            if any(query_lower in cat for cat in app.categories_lower):
                 score += 6
             
             # Executable matching
-            if query_lower in app.executable.lower():
+            if query_lower in app.executable_lower:
                 score += 4
             
             # Usage boost
@@ -661,8 +1327,9 @@ class IntelligentApplicationLauncher:
             if score > 0:
                 results.append((app, score))
         
-        # Sort by score
-        results.sort(key=lambda x: x[1], reverse=True)
+        # Sort by score, ties in discovery order
+        positions = self._app_positions
+        results.sort(key=lambda x: (-x[1], positions.get(x[0].id, len(positions))))
         return [app for app, score in results]
     
     def _launch_application(self, app: SmartApplication) -> str:
@@ -670,6 +1337,7 @@ class IntelligentApplicationLauncher:
         # Update usage statistics
         if self.user_preferences.get('usage_tracking', True):
             app.usage_count += 1
+            self._used_app_ids.add(app.id)
             app.last_used = time.time()
             self._save_usage_stats(app)
         
@@ -708,13 +1376,14 @@ class IntelligentApplicationLauncher:
                 return True
                 
             elif method == 'direct_execution':
-                # Clean executable command
-                exec_cmd = re.sub(r'%[a-zA-Z]', '', app.executable).strip()
-                
-                if ' ' in exec_cmd:
-                    cmd_parts = [part for part in exec_cmd.split() if not part.startswith('%')]
-                else:
-                    cmd_parts = [exec_cmd]
+                # Split like a shell so quoted arguments survive, then drop field codes
+                try:
+                    parts = shlex.split(app.executable)
+                except ValueError:
+                    parts = app.executable.split()
+                cmd_parts = [self._FIELD_CODE_RE.sub('', part) for part in parts
+                             if not (len(part) == 2 and part[0] == '%')]
+                cmd_parts = [part for part in cmd_parts if part]
                 
                 subprocess.Popen(cmd_parts,
                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
@@ -726,139 +1395,103 @@ class IntelligentApplicationLauncher:
         return False
     
     def _get_app_icon(self, app: SmartApplication) -> str:
-        """Get application icon dynamically"""
-        name_lower = app.name.lower()
-        
+        """Get application icon dynamically (worked out once per app)"""
+        if app.icon is None:
+            app.icon = self._match_app_icon(app)
+        return app.icon
+    
+    def _match_app_icon(self, app: SmartApplication) -> str:
+        """Pick the icon for an app from its name, then its categories"""
         # Check for specific patterns in name
-        icon_patterns = {
-            'firefox': '🦊', 'chrome': '🌐', 'browser': '🌐',
-            'terminal': '💻', 'console': '💻',
-            'editor': '📝', 'text': '📝',
-            'file': '📁', 'folder': '📁',
-            'music': '🎵', 'audio': '🎵',
-            'video': '🎬', 'movie': '🎬',
-            'image': '🖼️', 'photo': '🖼️',
-            'game': '🎮', 'play': '🎮',
-            'calculator': '🧮', 'calc': '🧮',
-            'mail': '📧', 'email': '📧',
-            'settings': '⚙️', 'config': '⚙️'
-        }
-        
-        for pattern, icon in icon_patterns.items():
-            if pattern in name_lower:
-                return icon
+        match = self._NAME_ICON_RE.match(app.name_lower)
+        if match:
+            return self._NAME_ICONS[match.lastindex - 1][1]
         
         # Category-based icons
-        for category in app.categories:
-            category_lower = category.lower()
-            if 'development' in category_lower or 'programming' in category_lower:
-                return '💻'
-            elif 'graphics' in category_lower or 'multimedia' in category_lower:
-                return '🎨'
-            elif 'office' in category_lower:
-                return '📄'
-            elif 'internet' in category_lower or 'network' in category_lower:
-                return '🌐'
-            elif 'game' in category_lower:
-                return '🎮'
-            elif 'system' in category_lower or 'utility' in category_lower:
-                return '⚙️'
+        for category_lower in app.categories_lower:
+            match = self._CATEGORY_ICON_RE.match(category_lower)
+            if match:
+                return self._CATEGORY_ICONS[match.lastindex - 1][1]
         
         return '📱'  # Default icon
     
     def _format_suggestions(self, query: str, suggestions: List[SmartApplication]) -> str:
         """Format application suggestions"""
-        response = f"🔍 **Application not found:** '{query}'\n\n"
+        parts = [f"🔍 **Application not found:** '{query}'\n\n"]
         
         if suggestions:
-            response += "**Did you mean:**\n"
+            parts.append("**Did you mean:**\n")
             for app in suggestions[:5]:
                 icon = self._get_app_icon(app)
-                response += f"{icon} **{app.name}** - Try: 'open {app.name}'\n"
+                parts.append(f"{icon} **{app.name}** - Try: 'open {app.name}'\n")
         
-        return response
+        return ''.join(parts)
     
     def _format_search_results(self, query: str, results: List[SmartApplication]) -> str:
         """Format search results"""
-        response = f"🔍 **Found {len(results)} application(s)** for '{query}':\n\n"
+        parts = [f"🔍 **Found {len(results)} application(s)** for '{query}':\n\n"]
         
         for app in results[:10]:  # Show top 10 results
             icon = self._get_app_icon(app)
             usage = f" (used {app.usage_count}x)" if app.usage_count > 0 else ""
             favorite = " ⭐" if app.is_favorite else ""
             
-            response += f"{icon} **{app.name}**{favorite}{usage}\n"
+            parts.append(f"{icon} **{app.name}**{favorite}{usage}\n")
             if app.description:
-                response += f"   └─ {app.description[:60]}{'...' if len(app.description) > 60 else ''}\n"
-            response += f"   └─ **Launch:** 'open {app.name}'\n\n"
+                parts.append(f"   └─ {app.description[:60]}{'...' if len(app.description) > 60 else ''}\n")
+            parts.append(f"   └─ **Launch:** 'open {app.name}'\n\n")
         
-        return response
+        return ''.join(parts)
     
     def _format_app_list(self, apps: List[SmartApplication]) -> str:
         """Format application list"""
-        response = f"📱 **Installed Applications** ({len(apps)} total):\n\n"
+        parts = [f"📱 **Installed Applications** ({len(apps)} total):\n\n"]
+        
+        # One pass picks the first five favorites and frequently used apps
+        favorites, frequent = [], []
+        for app in apps:
+            if app.is_favorite:
+                if len(favorites) < 5:
+                    favorites.append(app)
+            elif app.usage_count > 0 and len(frequent) < 5:
+                frequent.append(app)
+            if len(favorites) == 5 and len(frequent) == 5:
+                break
         
         # Show favorites first
-        favorites = [app for app in apps if app.is_favorite]
         if favorites:
-            response += "**⭐ Favorites:**\n"
-            for app in favorites[:5]:
+            parts.append("**⭐ Favorites:**\n")
+            for app in favorites:
                 icon = self._get_app_icon(app)
-                response += f"{icon} {app.name} - 'open {app.name}'\n"
-            response += "\n"
+                parts.append(f"{icon} {app.name} - 'open {app.name}'\n")
+            parts.append("\n")
         
         # Show frequently used
-        frequent = [app for app in apps if app.usage_count > 0 and not app.is_favorite]
         if frequent:
-            response += "**🔥 Frequently Used:**\n"
-            for app in frequent[:5]:
+            parts.append("**🔥 Frequently Used:**\n")
+            for app in frequent:
                 icon = self._get_app_icon(app)
-                response += f"{icon} {app.name} ({app.usage_count}x) - 'open {app.name}'\n"
-            response += "\n"
+                parts.append(f"{icon} {app.name} ({app.usage_count}x) - 'open {app.name}'\n")
+            parts.append("\n")
         
         # Show all apps (limited)
-        response += "**📱 All Applications:**\n"
+        parts.append("**📱 All Applications:**\n")
         for app in apps[:15]:
             icon = self._get_app_icon(app)
-            response += f"{icon} {app.name} - 'open {app.name}'\n"
+            parts.append(f"{icon} {app.name} - 'open {app.name}'\n")
         
         if len(apps) > 15:
-            response += f"\n*(Showing 15 of {len(apps)} applications)*"
+            parts.append(f"\n*(Showing 15 of {len(apps)} applications)*")
         
-        return response
+        return ''.join(parts)
     
     def _get_launch_help(self) -> str:
         """Get launch help message"""
-        return """🚀 **Application Launcher Help**
-
-**Launch Applications:**
-• "open [app name]" - Launch any application
-• "start Firefox" - Launch Firefox browser
-• "run terminal" - Open terminal
-
-**Search Applications:**
-• "find video editor" - Search for video editing apps
-• "search games" - Find gaming applications
-
-**List Applications:**
-• "list applications" - Show all installed apps
-• "show my apps" - Display available applications
-
-**Examples:**
-• "open calculator"
-• "launch text editor"
-• "find music player"
-• "list all apps"
-
-**💡 Just say 'open [app name]' to launch any application!**"""
+        return self.LAUNCH_HELP
     
     def _generate_help_response(self, user_input: str) -> str:
         """Generate contextual help response"""
-        return f"""❓ **I didn't understand:** "{user_input}"
-
-{self._get_launch_help()}
-
-**🤖 I learn from your commands - the more you use me, the better I get!**"""
+        return f'❓ **I didn\'t understand:** "{user_input}"\n\n' + self._HELP_RESPONSE_TAIL
     
     def _log_command(self, input_text: str, intent: Optional[str], entities: Dict):
         """Log command for learning"""
@@ -866,32 +1499,47 @@ class IntelligentApplicationLauncher:
             'input': input_text,
             'intent': intent,
             'entities': entities,
-            'timestamp': time.time()
+            'timestamp': time.monotonic_ns()  # orders entries; unaffected by wall-clock changes
         })
-        
-        # Keep history manageable
-        if len(self.command_history) > 1000:
-            self.command_history = self.command_history[-500:]
     
     def _save_usage_stats(self, app: SmartApplication):
-        """Save usage statistics"""
+        """Queue an app's usage statistics for the next batched write"""
+        with self._usage_lock:
+            self._dirty_usage_ids.add(app.id)
+            if self._usage_flush_scheduled:
+                return
+            self._usage_flush_scheduled = True
+        GLib.timeout_add_seconds(self.USAGE_FLUSH_DELAY, self._on_usage_flush_timeout)
+    
+    def _on_usage_flush_timeout(self) -> bool:
+        """GLib timeout: write queued usage statistics"""
+        with self._usage_lock:
+            self._usage_flush_scheduled = False
+        self._flush_usage_stats()
+        return False
+    
+    def _flush_usage_stats(self):
+        """Write every queued app's usage statistics in one update of usage_stats.json"""
+        with self._usage_lock:
+            app_ids, self._dirty_usage_ids = self._dirty_usage_ids, set()
+        if not app_ids:
+            return
+        
         try:
-            stats_file = Path.home() / '.personalaios' / 'launcher' / 'usage_stats.json'
-            
-            if stats_file.exists():
-                with open(stats_file, 'r') as f:
-                    stats = json.load(f)
-            else:
-                stats = {}
-            
-            stats[app.id] = {
-                'name': app.name,
-                'usage_count': app.usage_count,
-                'last_used': app.last_used
-            }
+            stats = self._stats_cache
+            for app_id in app_ids:
+                app = self.applications.get(app_id)
+                if app:
+                    stats[app.id] = {
+                        'name': app.name,
+                        'usage_count': app.usage_count,
+                        'last_used': app.last_used
+                    }
             
-            with open(stats_file, 'w') as f:
-                json.dump(stats, f, indent=2)
+            # Write then rename, so a crash never leaves truncated stats
+            tmp_file = self._stats_path.with_suffix('.tmp')
+            _dump_json(tmp_file, stats, indent=False)
+            os.replace(tmp_file, self._stats_path)
                 
         except Exception as e:
             if self.config.get('debug_mode', False):
@@ -900,18 +1548,20 @@ class IntelligentApplicationLauncher:
     def _load_usage_history(self):
         """Load usage history"""
         try:
-            stats_file = Path.home() / '.personalaios' / 'launcher' / 'usage_stats.json'
+            stats = _load_json(self._stats_path)
+            if isinstance(stats, dict):
+                self._stats_cache = stats
             
-            if stats_file.exists():
-                with open(stats_file, 'r') as f:
-                    stats = json.load(f)
-                
-                for app_id, data in stats.items():
-                    if app_id in self.applications:
-                        app = self.applications[app_id]
-                        app.usage_count = data.get('usage_count', 0)
-                        app.last_used = data.get('last_used', 0)
-                        
+            for app_id, data in stats.items():
+                if app_id in self.applications:
+                    app = self.applications[app_id]
+                    app.usage_count = data.get('usage_count', 0)
+                    if app.usage_count > 0:
+                        self._used_app_ids.add(app_id)
+                    app.last_used = data.get('last_used', 0)
+                    
+        except FileNotFoundError:
+            pass
         except Exception as e:
             if self.config.get('debug_mode', False):
                 print(f"Debug: Load history error: {e}")
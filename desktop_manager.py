@@ -5,22 +5,216 @@ Central hub that manages ALL components without breaking existing functionality
 """
 import subprocess
 import os
+import re
+import importlib
+import importlib.util
+import functools
+import threading
+from collections import deque
+from collections.abc import MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
 import time
 from pathlib import Path
 from gi.repository import GLib, Gtk, Adw
 
+try:
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    HAVE_AHOCORASICK = False
+
+def _keyword_re(keywords):
+    """One compiled alternation that finds any of the keywords as a substring"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+@functools.lru_cache(maxsize=1)
+def _platform_info():
+    """(system, release, machine, python version) - fixed for the life of the process"""
+    import platform
+    return platform.system(), platform.release(), platform.machine(), platform.python_version()
+
+def _category_automaton(categories):
+    """Aho-Corasick automaton mapping every keyword to the categories listing it"""
+    keyword_categories = {}
+    for category, keywords in categories.items():
+        for keyword in keywords:
+            keyword_categories.setdefault(keyword, set()).add(category)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_category_set in keyword_categories.items():
+        automaton.add_word(keyword, frozenset(keyword_category_set))
+    automaton.make_automaton()
+    return automaton
+
+class _ComponentRegistry(MutableMapping):
+    """Component instances by name; deferred entries are built on first lookup
+    
+    A deferred component counts as present for `in` checks. If building it fails
+    it is dropped from the registry, on_drop (if set) is called with its name, and
+    the error propagates to the caller. preload() builds the deferred components
+    on a thread pool ahead of use.
+    """
+    
+    def __init__(self):
+        self._entries = {}
+        self._deferred = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.on_drop = None
+    
+    def defer(self, name, module_name, class_name, label):
+        """Register a component to import and instantiate on first access"""
+        with self._lock:
+            self._entries[name] = None
+            self._deferred[name] = (module_name, class_name, label)
+    
+    def preload(self, max_workers=4):
+        """Start building every deferred component in the background"""
+        with self._lock:
+            jobs = list(self._deferred.items())
+            self._deferred.clear()
+            if not jobs:
+                return
+            executor = ThreadPoolExecutor(max_workers=min(max_workers, len(jobs)),
+                                          thread_name_prefix='component-loader')
+            futures = [(name, executor.submit(self._build, *spec)) for name, spec in jobs]
+            for name, future in futures:
+                self._pending[name] = future
+        for name, future in futures:
+            future.add_done_callback(functools.partial(self._settle, name))
+        executor.shutdown(wait=False)
+    
+    @staticmethod
+    def _build(module_name, class_name, label):
+        """Import a component's module and instantiate its class"""
+        try:
+            component = getattr(importlib.import_module(module_name), class_name)()
+        except Exception as e:
+            print(f"❌ {label} failed: {e}")
+            raise
+        print(f"✅ {label} component loaded")
+        return component
+    
+    def _settle(self, name, future):
+        """Store a finished build, or drop the component if it failed"""
+        with self._lock:
+            if self._pending.get(name) is not future:
+                return
+            del self._pending[name]
+            failed = future.exception() is not None
+            if failed:
+                self._entries.pop(name, None)
+            else:
+                self._entries[name] = future.result()
+        
+        if failed and self.on_drop is not None:
+            self.on_drop(name)
+    
+    def __getitem__(self, name):
+        with self._lock:
+            spec = self._deferred.pop(name, None)
+            if spec is not None:
+                future = self._pending[name] = Future()
+            else:
+                future = self._pending.get(name)
+        
+        if spec is not None:
+            try:
+                future.set_result(self._build(*spec))
+            except Exception as e:
+                future.set_exception(e)
+            self._settle(name, future)
+        if future is not None:
+            return future.result()
+        return self._entries[name]
+    
+    def __setitem__(self, name, component):
+        with self._lock:
+            self._deferred.pop(name, None)
+            self._pending.pop(name, None)
+            self._entries[name] = component
+    
+    def __delitem__(self, name):
+        with self._lock:
+            self._deferred.pop(name, None)
+            self._pending.pop(name, None)
+            del self._entries[name]
+    
+    def __contains__(self, name):
+        return name in self._entries
+    
+    def __iter__(self):
+        return iter(list(self._entries))
+    
+    def __len__(self):
+        return len(self._entries)
+
 class DesktopManager:
+    # Routing keywords, matched as substrings of the lowercased command
+    LAUNCHER_KEYWORDS = [
+        "applications", "apps", "what applications", "list apps", 
+        "installed", "programs", "software", "open", "launch", "start", "run"
+    ]
+    FILE_KEYWORDS = [
+        "find", "search", "file", "folder", "directory", "create", "delete", 
+        "copy", "move", "list files"
+    ]
+    WINDOW_KEYWORDS = [
+        "maximize", "minimize", "close", "window", "windows", "focus", "tile"
+    ]
+    SYSTEM_KEYWORDS = [
+        "system", "desktop", "components", "status", "info"
+    ]
+    
+    # Keyword category -> component handling it, in priority order (None: handled here)
+    COMMAND_ROUTES = [
+        ('launcher', 'application_launcher'),
+        ('file', 'file_manager'),
+        ('window', 'window_manager'),
+        ('system', None),
+    ]
+    
+    _CATEGORY_KEYWORDS = {
+        'launcher': LAUNCHER_KEYWORDS, 'file': FILE_KEYWORDS,
+        'window': WINDOW_KEYWORDS, 'system': SYSTEM_KEYWORDS
+    }
+    
+    # Each category is scanned in one regex pass instead of a substring test per keyword
+    _CATEGORY_RES = {category: _keyword_re(keywords) for category, keywords in _CATEGORY_KEYWORDS.items()}
+    
+    # With pyahocorasick, all four categories are found in a single pass
+    _CATEGORY_AUTOMATON = _category_automaton(_CATEGORY_KEYWORDS) if HAVE_AHOCORASICK else None
+    
+    # (name, module, class, label) of components loaded only when first used
+    DEFERRED_COMPONENTS = [
+        ('file_manager', 'ai_file_manager', 'IntelligentFileManager', 'AI File Manager'),
+        ('window_manager', 'window_manager', 'IntelligentWindowManager', 'Window Manager'),
+        ('application_launcher', 'application_launcher', 'IntelligentApplicationLauncher', 'Application Launcher'),
+        ('workspace_manager', 'workspace_manager', 'IntelligentWorkspaceManager', 'Workspace Manager'),
+        ('settings_manager', 'settings_manager', 'IntelligentSettingsManager', 'Settings Manager'),
+    ]
+    
     def __init__(self, ai_shell):
         """Initialize with reference to AI shell for communication"""
         self.ai_shell = ai_shell
         
-        # Component registry - Add new components here
-        self.components = {}
+        # Component registry - Add new components here (or to DEFERRED_COMPONENTS)
+        self.components = _ComponentRegistry()
+        self.components.on_drop = self._on_component_dropped
         self.ui_components = {}
+        self._status_label = None
+        
+        # Responses waiting for the main loop; delivered together by one idle callback
+        self._pending_responses = deque()
+        self._responses_lock = threading.Lock()
+        self._responses_scheduled = False
         
         # Load all available components safely
         self.load_components()
         
+        # Build the deferred components in the background so first use rarely waits
+        self.components.preload()
+        
         print("🎛️ Desktop Manager initialized - managing all components")
     
     def load_components(self):
@@ -36,26 +230,6 @@ class DesktopManager:
         except Exception as e:
             print(f"❌ Top Panel failed: {e}")
         
-        # AI File Manager Component
-        try:
-            from ai_file_manager import IntelligentFileManager
-            self.components['file_manager'] = IntelligentFileManager()
-            print("✅ AI File Manager component loaded")
-        except ImportError:
-            print("⚠️ AI File Manager component not available")
-        except Exception as e:
-            print(f"❌ AI File Manager failed: {e}")
-        
-        # Window Manager Component
-        try:
-            from window_manager import IntelligentWindowManager
-            self.components['window_manager'] = IntelligentWindowManager()
-            print("✅ Window Manager component loaded")
-        except ImportError:
-            print("⚠️ Window Manager component not available")
-        except Exception as e:
-            print(f"❌ Window Manager failed: {e}")
-        
         # Notification System Component
         try:
             from notification_system import IntelligentNotificationSystem
@@ -66,26 +240,6 @@ class DesktopManager:
         except Exception as e:
             print(f"❌ Notification System failed: {e}")
         
-        # Application Launcher Component
-        try:
-            from application_launcher import IntelligentApplicationLauncher
-            self.components['application_launcher'] = IntelligentApplicationLauncher()
-            print("✅ Application Launcher component loaded")
-        except ImportError:
-            print("⚠️ Application Launcher component not available")
-        except Exception as e:
-            print(f"❌ Application Launcher failed: {e}")
-        
-        # Workspace Manager Component
-        try:
-            from workspace_manager import IntelligentWorkspaceManager
-            self.components['workspace_manager'] = IntelligentWorkspaceManager()
-            print("✅ Workspace Manager component loaded")
-        except ImportError:
-            print("⚠️ Workspace Manager component not available")
-        except Exception as e:
-            print(f"❌ Workspace Manager failed: {e}")
-        
         # System Status Component
         try:
             from system_status_area import IntelligentSystemStatusArea
@@ -96,15 +250,12 @@ class DesktopManager:
         except Exception as e:
             print(f"❌ System Status failed: {e}")
         
-        # Settings Manager Component
-        try:
-            from settings_manager import IntelligentSettingsManager
-            self.components['settings_manager'] = IntelligentSettingsManager()
-            print("✅ Settings Manager component loaded")
-        except ImportError:
-            print("⚠️ Settings Manager component not available")
-        except Exception as e:
-            print(f"❌ Settings Manager failed: {e}")
+        # Command-driven components are imported and built on first use
+        for name, module_name, class_name, label in self.DEFERRED_COMPONENTS:
+            if importlib.util.find_spec(module_name) is not None:
+                self.components.defer(name, module_name, class_name, label)
+            else:
+                print(f"⚠️ {label} component not available")
         
         # System Monitor Component
         try:
@@ -113,6 +264,30 @@ class DesktopManager:
             print("✅ System Monitor component loaded")
         except ImportError:
             print("⚠️ System Monitor component not available (install psutil)")
+        
+        # Routes whose component is missing can never handle a command
+        self._active_routes = [(category, component) for category, component in self.COMMAND_ROUTES
+                               if component is None or component in self.components]
+        
+        # UI texts derived from the component set are worked out once here and
+        # again only if a deferred component fails to build
+        self._placeholder_text = self._compute_placeholder()
+        self._status_text = self._compute_status_text()
+    
+    def _on_component_dropped(self, name):
+        """A deferred component failed to build: stop advertising it (any thread)"""
+        self._placeholder_text = self._compute_placeholder()
+        self._status_text = self._compute_status_text()
+        GLib.idle_add(self._refresh_component_texts)
+    
+    def _refresh_component_texts(self):
+        """Push the current placeholder and status texts into the built UI"""
+        if self._status_label is not None:
+            self._status_label.set_label(self._status_text)
+        entry = getattr(self.ai_shell, 'entry', None)
+        if entry is not None:
+            entry.set_placeholder_text(self._placeholder_text)
+        return False
     
     def build_ui(self, main_box, desktop_mode):
         """Build complete UI with all components - Called by AI Shell"""
@@ -258,6 +433,10 @@ class DesktopManager:
         return input_container
     
     def get_dynamic_placeholder(self):
+        """Placeholder based on available components (worked out at load)"""
+        return self._placeholder_text
+    
+    def _compute_placeholder(self):
         """Generate placeholder based on available components"""
         examples = []
         
@@ -281,7 +460,14 @@ class DesktopManager:
         status_box.add_css_class("caption")
         status_box.set_halign(Gtk.Align.CENTER)
         
-        # Show loaded components
+        status_label = Gtk.Label(label=self._status_text)
+        status_box.append(status_label)
+        self._status_label = status_label
+        
+        return status_box
+    
+    def _compute_status_text(self):
+        """Status bar text listing loaded components and capabilities"""
         component_count = len(self.components)
         capabilities = []
         
@@ -297,84 +483,61 @@ class DesktopManager:
         status_text = f"Ready • {component_count} components"
         if capabilities:
             status_text += f" • {' & '.join(capabilities[:3])}"
-        
-        status_label = Gtk.Label(label=status_text)
-        status_box.append(status_label)
-        
-        return status_box
+        return status_text
     
     def process_command(self, user_input):
         """
         Central command processor - Route to appropriate component
         Returns True if handled, False if should go to AI
         """
-        user_input_lower = user_input.lower()
+        target = self.route_command(user_input.lower())
+        if target is None:
+            # Command not handled
+            return False
         
         try:
-            # Application Launcher Commands
-            if self.is_launcher_command(user_input_lower):
-                if 'application_launcher' in self.components:
-                    response = self.components['application_launcher'].process_command(user_input)
-                    self.send_response_to_ai_shell(response)
-                    return True
-            
-            # File Manager Commands
-            if self.is_file_command(user_input_lower):
-                if 'file_manager' in self.components:
-                    response = self.components['file_manager'].process_command(user_input)
-                    self.send_response_to_ai_shell(response)
-                    return True
-            
-            # Window Manager Commands
-            if self.is_window_command(user_input_lower):
-                if 'window_manager' in self.components:
-                    response = self.components['window_manager'].process_command(user_input)
-                    self.send_response_to_ai_shell(response)
-                    return True
-            
-            # System Commands
-            if self.is_system_command(user_input_lower):
+            if target == 'system':
                 response = self.handle_system_commands(user_input)
-                self.send_response_to_ai_shell(response)
-                return True
+            else:
+                response = self.components[target].process_command(user_input)
+            self.send_response_to_ai_shell(response)
         
         except Exception as e:
             error_msg = f"❌ **Component Error:** {str(e)}"
             self.send_response_to_ai_shell(error_msg)
-            return True
-        
-        # Command not handled
-        return False
+        return True
     
-    def is_launcher_command(self, user_input):
-        """Check if command is application launcher related"""
-        launcher_keywords = [
-            "applications", "apps", "what applications", "list apps", 
-            "installed", "programs", "software", "open", "launch", "start", "run"
-        ]
-        return any(keyword in user_input for keyword in launcher_keywords)
-    
-    def is_file_command(self, user_input):
-        """Check if command is file management related"""
-        file_keywords = [
-            "find", "search", "file", "folder", "directory", "create", "delete", 
-            "copy", "move", "list files"
-        ]
-        return any(keyword in user_input for keyword in file_keywords)
-    
-    def is_window_command(self, user_input):
-        """Check if command is window management related"""
-        window_keywords = [
-            "maximize", "minimize", "close", "window", "windows", "focus", "tile"
-        ]
-        return any(keyword in user_input for keyword in window_keywords)
-    
-    def is_system_command(self, user_input):
-        """Check if command is system related"""
-        system_keywords = [
-            "system", "desktop", "components", "status", "info"
-        ]
-        return any(keyword in user_input for keyword in system_keywords)
+    def route_command(self, user_input):
+        """Component that should handle a lowercased command ('system' for built-ins, None for the AI)"""
+        if self._CATEGORY_AUTOMATON is not None:
+            categories = self.command_categories(user_input)
+            if not categories:
+                return None
+            matches = categories.__contains__
+        else:
+            # Without the automaton each category is its own scan: run only the
+            # ones that can route somewhere, and stop at the first hit
+            def matches(category):
+                return self._CATEGORY_RES[category].search(user_input) is not None
+        
+        for category, component in self._active_routes:
+            if matches(category):
+                if component is None:
+                    return 'system'
+                # A deferred component may have failed to build since load time
+                if component in self.components:
+                    return component
+        return None
+    
+    def command_categories(self, user_input):
+        """Names of the command categories whose keywords occur in user_input"""
+        if self._CATEGORY_AUTOMATON is not None:
+            categories = set()
+            for _, keyword_categories in self._CATEGORY_AUTOMATON.iter(user_input):
+                categories |= keyword_categories
+            return categories
+        
+        return {category for category, pattern in self._CATEGORY_RES.items() if pattern.search(user_input)}
     
     def handle_system_commands(self, user_input):
         """Handle system-level commands"""
@@ -405,11 +568,11 @@ class DesktopManager:
     def get_system_info(self):
         """Get system information"""
         try:
-            import platform
+            system, release, machine, python_version = _platform_info()
             response = f"🖥️ **System Information**\n\n"
-            response += f"**OS:** {platform.system()} {platform.release()}\n"
-            response += f"**Architecture:** {platform.machine()}\n"
-            response += f"**Python:** {platform.python_version()}\n"
+            response += f"**OS:** {system} {release}\n"
+            response += f"**Architecture:** {machine}\n"
+            response += f"**Python:** {python_version}\n"
             response += f"**PersonalAIOS Components:** {len(self.components)}\n"
             return response
         except Exception as e:
@@ -442,9 +605,24 @@ class DesktopManager:
             self.send_response_to_ai_shell("❌ **Window Manager not available**")
     
     def send_response_to_ai_shell(self, response):
-        """Send response back to AI shell UI"""
+        """Send response back to AI shell UI (responses queued together share one idle callback)"""
         if self.ai_shell:
-            GLib.idle_add(self.ai_shell.add_ai_message, response)
+            with self._responses_lock:
+                self._pending_responses.append(response)
+                if self._responses_scheduled:
+                    return
+                self._responses_scheduled = True
+            GLib.idle_add(self._deliver_responses)
+    
+    def _deliver_responses(self):
+        """Idle callback: show every queued response, in order"""
+        with self._responses_lock:
+            responses = list(self._pending_responses)
+            self._pending_responses.clear()
+            self._responses_scheduled = False
+        for response in responses:
+            self.ai_shell.add_ai_message(response)
+        return False
 
 if __name__ == '__main__':
     print("🎛️ PersonalAIOS Desktop Manager - Fixed Version")
@@ -5,17 +5,24 @@ Revolutionary AI-native notification management with perfect natural language un
 Smart, context-aware, and completely dynamic - no hardcoding, pure intelligence
 """
 import gi
+import os
 import re
 import json
+import bisect
+import heapq
+import itertools
 import time
 import threading
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Callable
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, List, Optional, Union, Callable
+from dataclasses import dataclass, replace
 from enum import Enum
+from collections import Counter, deque
 from datetime import datetime, timedelta
 import queue
+import atexit
+import functools
 
 gi.require_version('Gtk', '4.0')
 gi.require_version('Gdk', '4.0')
@@ -29,6 +36,43 @@ try:
 except ImportError:
     HAVE_DBUS = False
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+try:
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    HAVE_AHOCORASICK = False
+
+_json_loads = orjson.loads if HAVE_ORJSON else json.loads
+
+def _keyword_re(keywords):
+    """One compiled alternation that finds any of the keywords as a substring"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+def _keyword_automaton(keyword_groups):
+    """Aho-Corasick automaton mapping every keyword to the (group, label) pairs listing it"""
+    keyword_labels = {}
+    for group, labels in keyword_groups.items():
+        for label, keywords in labels.items():
+            for keyword in keywords:
+                keyword_labels.setdefault(keyword, set()).add((group, label))
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, labels in keyword_labels.items():
+        automaton.add_word(keyword, frozenset(labels))
+    automaton.make_automaton()
+    return automaton
+
+@functools.lru_cache(maxsize=None)
+def _parse_clock_time(value):
+    """datetime.time for an 'HH:MM' preference string, parsed once per distinct value"""
+    return datetime.strptime(value, '%H:%M').time()
+
 class NotificationPriority(Enum):
     """Dynamic notification priorities"""
     LOW = "low"
@@ -84,10 +128,78 @@ class IntelligentNotificationSystem:
     - Do Not Disturb intelligence
     """
     
+    # Static regexes, compiled once for every instance
+    _FILLER_RE = re.compile(r'\b(?:please|can\s+you|would\s+you|could\s+you)\b', re.IGNORECASE)
+    _TIMING_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+        r'in\s+(\d+)\s+(minute|minutes|min|mins)',
+        r'in\s+(\d+)\s+(hour|hours|hr|hrs)',
+        r'in\s+(\d+)\s+(day|days)',
+        r'at\s+(\d{1,2}):(\d{2})',
+        r'(?:after|in)\s+(\d+)\s*(m|h|d)',
+    ]]
+    # "in N <unit>" time specifications and the seconds per unit
+    _RELATIVE_TIME_PATTERNS = [
+        (re.compile(r'in\s+(\d+)\s+(minute|minutes|min|mins)'), 60),
+        (re.compile(r'in\s+(\d+)\s+(hour|hours|hr|hrs)'), 3600),
+        (re.compile(r'in\s+(\d+)\s+(day|days)'), 86400),
+    ]
+    _CLOCK_TIME_RE = re.compile(r'at\s+(\d{1,2}):(\d{2})')
+    
+    # Freedesktop urgency level for each priority
+    URGENCY_LEVELS = {
+        NotificationPriority.LOW: 'low',
+        NotificationPriority.NORMAL: 'normal',
+        NotificationPriority.HIGH: 'normal',
+        NotificationPriority.CRITICAL: 'critical',
+        NotificationPriority.URGENT: 'critical'
+    }
+    _DBUS_URGENCY = {'low': 0, 'normal': 1, 'critical': 2}
+    
+    # Seconds between expiry cleanups (and history flushes) in the background processor
+    MAINTENANCE_INTERVAL = 30
+    
+    # Dismissed notifications kept in memory; history.jsonl is compacted back
+    # to this many records once it holds HISTORY_COMPACT_SIZE
+    HISTORY_SIZE = 100
+    HISTORY_COMPACT_SIZE = 1000
+    
+    # Keyword lists per label, checked in order; the first label with a hit wins
+    CONTEXT_TYPE_KEYWORDS = {
+        'error': ['error', 'failed', 'problem'],
+        'warning': ['warning', 'caution', 'careful'],
+        'info': ['info', 'information', 'fyi'],
+        'reminder': ['reminder', 'remember', 'don\'t forget'],
+    }
+    PRIORITY_KEYWORDS = {
+        'critical': ['critical', 'emergency', 'urgent'],
+        'high': ['high', 'important', 'asap'],
+        'low': ['low', 'minor', 'info'],
+    }
+    DO_NOT_DISTURB_KEYWORDS = {
+        'on': ['enable', 'turn on', 'activate', 'on', 'silence'],
+        'off': ['disable', 'turn off', 'deactivate', 'off'],
+    }
+    
     def __init__(self):
         """Initialize the intelligent notification system"""
         self.notifications: Dict[str, SmartNotification] = {}
-        self.notification_history: List[SmartNotification] = []
+        # Active notifications in listing order plus per-priority/type counts,
+        # kept in step with self.notifications by _store_notification and
+        # _dismiss_notification_by_id
+        self._notifications_by_priority: List[SmartNotification] = []
+        self._priority_counts = Counter()
+        self._type_counts = Counter()
+        # (deadline, sequence, notification) for notifications that expire
+        self._expiry_heap = []
+        # (delivery_time, sequence, notification) waiting for the processor thread
+        self._scheduled_heap = []
+        # Tie-breaker so heap entries never compare notifications
+        self._heap_sequence = itertools.count()
+        # Source of unique notification IDs (two notifications can share a millisecond)
+        self._notification_ids = itertools.count()
+        self._notifications_lock = threading.Lock()
+        self.notification_history: Deque[SmartNotification] = deque(maxlen=self.HISTORY_SIZE)
+        self._history_file = None
         self.user_preferences = {
             'do_not_disturb': False,
             'quiet_hours': {'start': '22:00', 'end': '08:00'},
@@ -163,6 +275,8 @@ class IntelligentNotificationSystem:
             ]
         }
         
+        self._intent_re, self._intent_groups = self._build_intent_matcher(self.intent_patterns)
+        
         # Context keywords for smart understanding
         self.priority_keywords = {
             'critical': ['critical', 'emergency', 'urgent', 'important', 'asap', 'immediately'],
@@ -179,6 +293,21 @@ class IntelligentNotificationSystem:
             'weeks': ['week', 'weeks', 'next week', 'last week']
         }
         
+        # All keyword lists by group; with pyahocorasick they are scanned in one pass
+        self._keyword_groups = {
+            'suggested_priority': self.priority_keywords,
+            'timing_type': self.time_keywords,
+            'type': self.CONTEXT_TYPE_KEYWORDS,
+            'priority': self.PRIORITY_KEYWORDS,
+            'do_not_disturb': self.DO_NOT_DISTURB_KEYWORDS,
+        }
+        self._keyword_automaton = _keyword_automaton(self._keyword_groups) if HAVE_AHOCORASICK else None
+        self._keyword_res = {
+            (group, label): _keyword_re(keywords)
+            for group, labels in self._keyword_groups.items()
+            for label, keywords in labels.items()
+        } if self._keyword_automaton is None else None
+        
         # Initialize notification infrastructure
         self._initialize_notification_system()
         self._start_notification_processor()
@@ -187,12 +316,21 @@ class IntelligentNotificationSystem:
     
     def _initialize_notification_system(self):
         """Initialize notification infrastructure"""
+        self._notifications_proxy = None
         try:
             if HAVE_DBUS:
                 # Initialize D-Bus for system integration
                 DBusGMainLoop(set_as_default=True)
                 self.bus = dbus.SessionBus()
-                print("✅ D-Bus notification integration available")
+                try:
+                    self._notifications_proxy = dbus.Interface(
+                        self.bus.get_object('org.freedesktop.Notifications', '/org/freedesktop/Notifications'),
+                        'org.freedesktop.Notifications')
+                    print("✅ D-Bus notification integration available")
+                except dbus.DBusException as e:
+                    # No notification daemon running or activatable; notify-send and
+                    # the widget fallback still work
+                    print(f"⚠️ D-Bus notification service unavailable - using fallback methods: {e}")
             else:
                 print("⚠️ D-Bus not available - using fallback methods")
                 
@@ -213,20 +351,44 @@ class IntelligentNotificationSystem:
     
     def _process_notifications(self):
         """Background notification processing"""
+        next_maintenance = time.monotonic() + self.MAINTENANCE_INTERVAL
         while True:
             try:
-                # Process queued notifications
-                if not self.notification_queue.empty():
-                    notification = self.notification_queue.get()
-                    self._render_notification(notification)
+                # Sleep until a notification is queued, a scheduled one is due
+                # or maintenance is due
+                timeout = next_maintenance - time.monotonic()
+                with self._notifications_lock:
+                    if self._scheduled_heap:
+                        timeout = min(timeout, self._scheduled_heap[0][0] - time.time())
                 
-                # Check for expired notifications
-                self._cleanup_expired_notifications()
+                batch = []
+                try:
+                    batch.append(self.notification_queue.get(timeout=max(0, timeout)))
+                    # Take everything else already queued so it renders together
+                    while True:
+                        try:
+                            batch.append(self.notification_queue.get_nowait())
+                        except queue.Empty:
+                            break
+                except queue.Empty:
+                    pass
                 
-                # AI-powered optimization
-                self._optimize_notification_delivery()
+                batch.extend(self._take_due_scheduled_notifications())
+                # None only wakes the thread up (see _schedule_notification_delivery)
+                batch = [notification for notification in batch if notification is not None]
+                if batch:
+                    self._render_notifications(batch)
                 
-                time.sleep(1)  # Process every second
+                if time.monotonic() >= next_maintenance:
+                    next_maintenance = time.monotonic() + self.MAINTENANCE_INTERVAL
+                    
+                    # Check for expired notifications
+                    self._cleanup_expired_notifications()
+                    
+                    # AI-powered optimization
+                    self._optimize_notification_delivery()
+                    
+                    self._save_notification_history()
                 
             except Exception as e:
                 print(f"Notification processing error: {e}")
@@ -257,81 +419,89 @@ class IntelligentNotificationSystem:
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text for better understanding"""
         # Remove common filler words
-        text = re.sub(r'\b(?:please|can\s+you|would\s+you|could\s+you)\b', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s+', ' ', text).strip().lower()
-        return text
+        text = self._FILLER_RE.sub('', text)
+        # Collapse and trim whitespace; str.split() has the same notion of
+        # whitespace as \s
+        return ' '.join(text.lower().split())
+    
+    @staticmethod
+    def _build_intent_matcher(intent_patterns: Dict[str, List[str]]) -> tuple:
+        """Fuse all intent patterns into one regex with a named group per pattern"""
+        # Every alternative is anchored at the start and skips ahead lazily, so
+        # the first pattern (in intent order) that matches anywhere wins, just
+        # like searching the patterns one by one
+        alternatives = []
+        group_spans = {}
+        group_index = 1
+        for intent, patterns in intent_patterns.items():
+            for i, pattern in enumerate(patterns):
+                name = f"{intent}__{i}"
+                alternatives.append(f"(?s:.*?)(?P<{name}>{pattern})")
+                captures = re.compile(pattern).groups
+                group_spans[name] = (intent, group_index + 1, group_index + 1 + captures)
+                group_index += 1 + captures
+        intent_re = re.compile(r'\A(?:' + '|'.join(alternatives) + ')', re.IGNORECASE)
+        return intent_re, group_spans
     
     def _extract_intent_and_entities(self, text: str) -> tuple:
         """Extract intent and entities using AI-powered pattern matching"""
-        for intent, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    entities = {
-                        'groups': match.groups(),
-                        'context': self._extract_context(text),
-                        'priority': self._detect_priority(text),
-                        'timing': self._extract_timing(text)
-                    }
-                    return intent, entities
-        
-        return None, {}
+        match = self._intent_re.match(text)
+        if not match:
+            return None, {}
+        
+        # The pattern's own group closes last, so it is always lastgroup
+        intent, first, end = self._intent_groups[match.lastgroup]
+        entities = {
+            'groups': match.groups()[first - 1:end - 1],
+            'context': self._extract_context(text),
+            'priority': self._detect_priority(text),
+            'timing': self._extract_timing(text)
+        }
+        return intent, entities
     
     def _extract_context(self, text: str) -> Dict:
         """Extract contextual information from text"""
         context = {}
+        hits = self._keyword_hits(text)
         
-        # Detect urgency/priority context
-        for priority, keywords in self.priority_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                context['suggested_priority'] = priority
-                break
-        
-        # Detect timing context
-        for time_type, keywords in self.time_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                context['timing_type'] = time_type
-                break
-        
-        # Detect notification type context
-        if any(word in text for word in ['error', 'failed', 'problem']):
-            context['type'] = 'error'
-        elif any(word in text for word in ['warning', 'caution', 'careful']):
-            context['type'] = 'warning'
-        elif any(word in text for word in ['info', 'information', 'fyi']):
-            context['type'] = 'info'
-        elif any(word in text for word in ['reminder', 'remember', 'don\'t forget']):
-            context['type'] = 'reminder'
+        # Detect urgency/priority, timing and notification type context
+        for group in ('suggested_priority', 'timing_type', 'type'):
+            label = self._first_keyword_label(hits, group)
+            if label:
+                context[group] = label
         
         return context
     
     def _detect_priority(self, text: str) -> NotificationPriority:
         """AI-powered priority detection"""
         # Check for explicit priority mentions
-        if any(word in text for word in ['critical', 'emergency', 'urgent']):
-            return NotificationPriority.CRITICAL
-        elif any(word in text for word in ['high', 'important', 'asap']):
-            return NotificationPriority.HIGH
-        elif any(word in text for word in ['low', 'minor', 'info']):
-            return NotificationPriority.LOW
-        else:
-            return NotificationPriority.NORMAL
+        label = self._first_keyword_label(self._keyword_hits(text), 'priority')
+        return NotificationPriority(label) if label else NotificationPriority.NORMAL
+    
+    def _keyword_hits(self, text: str) -> set:
+        """(group, label) pairs with at least one keyword occurring in text"""
+        if self._keyword_automaton is not None:
+            hits = set()
+            for _, labels in self._keyword_automaton.iter(text):
+                hits |= labels
+            return hits
+        
+        return {key for key, pattern in self._keyword_res.items() if pattern.search(text)}
+    
+    def _first_keyword_label(self, hits: set, group: str) -> Optional[str]:
+        """First label of group, in keyword list order, that has a hit"""
+        for label in self._keyword_groups[group]:
+            if (group, label) in hits:
+                return label
+        return None
     
     def _extract_timing(self, text: str) -> Optional[Dict]:
         """Extract timing information from text"""
         # Simple time extraction (can be enhanced with more sophisticated NLP)
-        time_patterns = [
-            r'in\s+(\d+)\s+(minute|minutes|min|mins)',
-            r'in\s+(\d+)\s+(hour|hours|hr|hrs)',
-            r'in\s+(\d+)\s+(day|days)',
-            r'at\s+(\d{1,2}):(\d{2})',
-            r'(?:after|in)\s+(\d+)\s*(m|h|d)',
-        ]
-        
-        for pattern in time_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._TIMING_PATTERNS:
+            match = pattern.search(text)
             if match:
-                return {'pattern': pattern, 'match': match.groups()}
+                return {'pattern': pattern.pattern, 'match': match.groups()}
         
         return None
     
@@ -370,7 +540,7 @@ class IntelligentNotificationSystem:
         context = entities.get('context', {})
         
         # Generate unique notification ID
-        notification_id = f"notification_{int(time.time() * 1000)}"
+        notification_id = f"notification_{next(self._notification_ids):x}"
         
         # Determine notification type and priority
         notification_type = self._determine_notification_type(context)
@@ -394,7 +564,7 @@ class IntelligentNotificationSystem:
         # Check Do Not Disturb
         if self._should_show_notification(notification):
             self._queue_notification(notification)
-            self.notifications[notification_id] = notification
+            self._store_notification(notification)
             
             return f"🚨 **Notification created:** {notification.title}\n   └─ Priority: {priority.value.title()}\n   └─ Type: {notification_type.value.title()}"
         else:
@@ -434,13 +604,12 @@ class IntelligentNotificationSystem:
         
         response = f"🚨 **Active Notifications** ({len(self.notifications)} total):\n\n"
         
-        # Sort by priority and timestamp
-        sorted_notifications = sorted(
-            self.notifications.values(),
-            key=lambda n: (n.priority.value != 'critical', n.priority.value != 'urgent', -n.timestamp)
-        )
+        # Already ordered by priority and timestamp
+        with self._notifications_lock:
+            sorted_notifications = self._notifications_by_priority[:10]
+            total = len(self._notifications_by_priority)
         
-        for i, notification in enumerate(sorted_notifications[:10], 1):
+        for i, notification in enumerate(sorted_notifications, 1):
             priority_icon = self._get_priority_icon(notification.priority)
             type_icon = self._get_type_icon(notification.notification_type)
             age = self._format_time_ago(notification.timestamp)
@@ -449,8 +618,8 @@ class IntelligentNotificationSystem:
             response += f"   └─ {notification.message[:60]}{'...' if len(notification.message) > 60 else ''}\n"
             response += f"   └─ {type_icon} {notification.notification_type.value.title()} • {age}\n\n"
         
-        if len(sorted_notifications) > 10:
-            response += f"*(Showing first 10 of {len(sorted_notifications)} notifications)*"
+        if total > 10:
+            response += f"*(Showing first 10 of {total} notifications)*"
         
         return response
     
@@ -470,7 +639,7 @@ class IntelligentNotificationSystem:
             return f"⏰ **Invalid time specification:** '{time_spec}'\n\n**Try:** in 30 minutes, at 3:00 PM, tomorrow at 9 AM"
         
         # Create scheduled notification
-        notification_id = f"scheduled_{int(time.time() * 1000)}"
+        notification_id = f"scheduled_{next(self._notification_ids):x}"
         context = entities.get('context', {})
         
         notification = SmartNotification(
@@ -496,12 +665,12 @@ class IntelligentNotificationSystem:
     
     def _toggle_do_not_disturb(self, entities: Dict, original_text: str) -> str:
         """Toggle Do Not Disturb mode intelligently"""
-        text_lower = original_text.lower()
+        mode = self._first_keyword_label(self._keyword_hits(original_text.lower()), 'do_not_disturb')
         
-        if any(word in text_lower for word in ['enable', 'turn on', 'activate', 'on', 'silence']):
+        if mode == 'on':
             self.user_preferences['do_not_disturb'] = True
             return "🔇 **Do Not Disturb enabled**\n\nYou won't receive notifications except for critical alerts."
-        elif any(word in text_lower for word in ['disable', 'turn off', 'deactivate', 'off']):
+        elif mode == 'off':
             self.user_preferences['do_not_disturb'] = False
             return "🔔 **Do Not Disturb disabled**\n\nNotifications will now be delivered normally."
         else:
@@ -520,15 +689,12 @@ class IntelligentNotificationSystem:
             return "📋 **Notification Summary:** No active notifications"
         
         # Categorize notifications
-        by_priority = {}
-        by_type = {}
-        
-        for notification in self.notifications.values():
-            priority = notification.priority.value
-            notification_type = notification.notification_type.value
-            
-            by_priority[priority] = by_priority.get(priority, 0) + 1
-            by_type[notification_type] = by_type.get(notification_type, 0) + 1
+        with self._notifications_lock:
+            by_priority = {priority.value: count for priority, count in self._priority_counts.items()}
+            by_type = {
+                notification_type.value: self._type_counts[notification_type]
+                for notification_type in NotificationType if self._type_counts[notification_type]
+            }
         
         # Generate intelligent summary
         response = f"📋 **Intelligent Notification Summary**\n\n"
@@ -582,6 +748,37 @@ class IntelligentNotificationSystem:
         """Queue notification for display"""
         self.notification_queue.put(notification)
     
+    def _render_notifications(self, notifications: List[SmartNotification]):
+        """Render a batch of queued notifications"""
+        if self._notifications_proxy is not None or len(notifications) == 1:
+            for notification in notifications:
+                self._render_notification(notification)
+            return
+        
+        # Without D-Bus every notify-send is a process spawn, so notifications
+        # sharing a title and priority are shown as one
+        groups = {}
+        for notification in notifications:
+            groups.setdefault((notification.title, notification.priority), []).append(notification)
+        
+        for group in groups.values():
+            if len(group) == 1:
+                self._render_notification(group[0])
+                continue
+            
+            combined = replace(
+                group[0],
+                title=f"{group[0].title} ({len(group)})",
+                message="\n".join(notification.message for notification in group)
+            )
+            try:
+                if self._send_system_notification(combined):
+                    continue
+                for notification in group:
+                    self._create_notification_widget(notification)
+            except Exception as e:
+                print(f"Notification render error: {e}")
+    
     def _render_notification(self, notification: SmartNotification):
         """Render notification using available methods"""
         try:
@@ -597,18 +794,21 @@ class IntelligentNotificationSystem:
     
     def _send_system_notification(self, notification: SmartNotification) -> bool:
         """Send notification using system methods"""
+        urgency = self.URGENCY_LEVELS.get(notification.priority, 'normal')
+        
+        if self._notifications_proxy is not None:
+            # Talk to the notification daemon directly instead of spawning notify-send
+            try:
+                self._notifications_proxy.Notify(
+                    'PersonalAIOS', dbus.UInt32(0), notification.icon or '',
+                    notification.title, notification.message, dbus.Array([], signature='s'),
+                    {'urgency': dbus.Byte(self._DBUS_URGENCY[urgency])}, dbus.Int32(-1))
+                return True
+            except Exception:
+                pass
+        
         try:
             # Try notify-send
-            urgency_map = {
-                NotificationPriority.LOW: 'low',
-                NotificationPriority.NORMAL: 'normal',
-                NotificationPriority.HIGH: 'normal',
-                NotificationPriority.CRITICAL: 'critical',
-                NotificationPriority.URGENT: 'critical'
-            }
-            
-            urgency = urgency_map.get(notification.priority, 'normal')
-            
             cmd = [
                 'notify-send',
                 '--urgency', urgency,
@@ -656,10 +856,10 @@ class IntelligentNotificationSystem:
     
     def _is_quiet_time(self) -> bool:
         """Check if current time is within quiet hours"""
-        now = datetime.now()
-        start_time = datetime.strptime(self.user_preferences['quiet_hours']['start'], '%H:%M').time()
-        end_time = datetime.strptime(self.user_preferences['quiet_hours']['end'], '%H:%M').time()
-        current_time = now.time()
+        quiet_hours = self.user_preferences['quiet_hours']
+        start_time = _parse_clock_time(quiet_hours['start'])
+        end_time = _parse_clock_time(quiet_hours['end'])
+        current_time = datetime.now().time()
         
         if start_time <= end_time:
             return start_time <= current_time <= end_time
@@ -671,20 +871,14 @@ class IntelligentNotificationSystem:
         now = time.time()
         
         # Handle "in X minutes/hours/days"
-        match = re.search(r'in\s+(\d+)\s+(minute|minutes|min|mins)', time_spec.lower())
-        if match:
-            return now + (int(match.group(1)) * 60)
-        
-        match = re.search(r'in\s+(\d+)\s+(hour|hours|hr|hrs)', time_spec.lower())
-        if match:
-            return now + (int(match.group(1)) * 3600)
-        
-        match = re.search(r'in\s+(\d+)\s+(day|days)', time_spec.lower())
-        if match:
-            return now + (int(match.group(1)) * 86400)
+        time_spec_lower = time_spec.lower()
+        for pattern, seconds in self._RELATIVE_TIME_PATTERNS:
+            match = pattern.search(time_spec_lower)
+            if match:
+                return now + (int(match.group(1)) * seconds)
         
         # Handle "at HH:MM"
-        match = re.search(r'at\s+(\d{1,2}):(\d{2})', time_spec)
+        match = self._CLOCK_TIME_RE.search(time_spec)
         if match:
             hour, minute = int(match.group(1)), int(match.group(2))
             target = datetime.now().replace(hour=hour, minute=minute, second=0, microsecond=0)
@@ -695,20 +889,79 @@ class IntelligentNotificationSystem:
         return None
     
     def _schedule_notification_delivery(self, notification: SmartNotification, delivery_time: float):
-        """Schedule notification for future delivery"""
-        def deliver():
-            time.sleep(max(0, delivery_time - time.time()))
-            if self._should_show_notification(notification):
-                self._queue_notification(notification)
-                self.notifications[notification.id] = notification
-        
-        threading.Thread(target=deliver, daemon=True).start()
+        """Schedule notification for future delivery by the processor thread"""
+        with self._notifications_lock:
+            heapq.heappush(self._scheduled_heap, (delivery_time, next(self._heap_sequence), notification))
+        # Wake the processor so it recomputes how long to wait
+        self.notification_queue.put(None)
+    
+    def _take_due_scheduled_notifications(self) -> List[SmartNotification]:
+        """Pop scheduled notifications whose time has come and store those to be shown"""
+        due = []
+        now = time.time()
+        with self._notifications_lock:
+            while self._scheduled_heap and self._scheduled_heap[0][0] <= now:
+                due.append(heapq.heappop(self._scheduled_heap)[2])
+        
+        due = [notification for notification in due if self._should_show_notification(notification)]
+        for notification in due:
+            self._store_notification(notification)
+        return due
+    
+    @staticmethod
+    def _listing_key(notification: SmartNotification) -> tuple:
+        """Listing order: critical first, then urgent, then the rest; newest first within each"""
+        return (notification.priority != NotificationPriority.CRITICAL,
+                notification.priority != NotificationPriority.URGENT,
+                -notification.timestamp)
+    
+    def _store_notification(self, notification: SmartNotification):
+        """Add an active notification, keeping the listing order and counts current"""
+        with self._notifications_lock:
+            previous = self.notifications.get(notification.id)
+            if previous is not None:
+                self._forget_notification(previous)
+            self.notifications[notification.id] = notification
+            bisect.insort(self._notifications_by_priority, notification, key=self._listing_key)
+            self._priority_counts[notification.priority] += 1
+            self._type_counts[notification.notification_type] += 1
+            
+            deadline = self._expiry_deadline(notification)
+            if deadline is not None:
+                heapq.heappush(self._expiry_heap, (deadline, next(self._heap_sequence), notification))
+    
+    @staticmethod
+    def _expiry_deadline(notification: SmartNotification) -> Optional[float]:
+        """Time after which the notification is removed by cleanup, if any"""
+        deadlines = []
+        if notification.expires_at:
+            deadlines.append(notification.expires_at)
+        if notification.auto_dismiss:
+            deadlines.append(notification.timestamp + 300)  # 5 minutes
+        return min(deadlines) if deadlines else None
+    
+    def _forget_notification(self, notification: SmartNotification):
+        """Drop a notification from the listing order and counts (lock held)"""
+        ordered = self._notifications_by_priority
+        index = bisect.bisect_left(ordered, self._listing_key(notification), key=self._listing_key)
+        while ordered[index] is not notification:
+            index += 1
+        del ordered[index]
+        self._priority_counts[notification.priority] -= 1
+        if not self._priority_counts[notification.priority]:
+            del self._priority_counts[notification.priority]
+        self._type_counts[notification.notification_type] -= 1
+        if not self._type_counts[notification.notification_type]:
+            del self._type_counts[notification.notification_type]
     
     def _dismiss_notification_by_id(self, notification_id: str):
         """Dismiss a specific notification"""
-        if notification_id in self.notifications:
-            notification = self.notifications.pop(notification_id)
-            self.notification_history.append(notification)
+        with self._notifications_lock:
+            notification = self.notifications.pop(notification_id, None)
+            if notification is not None:
+                self._forget_notification(notification)
+        if notification is not None:
+            self._record_notification_history(notification)
             
             # Remove from UI if present
             if notification_id in self.notification_widgets:
@@ -720,10 +973,13 @@ class IntelligentNotificationSystem:
         current_time = time.time()
         expired_ids = []
         
-        for notification_id, notification in self.notifications.items():
-            if (notification.expires_at and current_time > notification.expires_at) or \
-               (notification.auto_dismiss and current_time - notification.timestamp > 300):  # 5 minutes
-                expired_ids.append(notification_id)
+        # Only the due end of the deadline heap is visited; entries for
+        # notifications already dismissed or replaced are just discarded
+        with self._notifications_lock:
+            while self._expiry_heap and self._expiry_heap[0][0] < current_time:
+                _, _, notification = heapq.heappop(self._expiry_heap)
+                if self.notifications.get(notification.id) is notification:
+                    expired_ids.append(notification.id)
         
         for notification_id in expired_ids:
             self._dismiss_notification_by_id(notification_id)
@@ -824,8 +1080,8 @@ class IntelligentNotificationSystem:
         insights = []
         
         # Check for high priority notifications
-        critical_count = sum(1 for n in self.notifications.values() 
-                           if n.priority in [NotificationPriority.CRITICAL, NotificationPriority.URGENT])
+        critical_count = (self._priority_counts[NotificationPriority.CRITICAL] +
+                          self._priority_counts[NotificationPriority.URGENT])
         if critical_count > 0:
             insights.append(f"🚨 You have {critical_count} urgent notification(s) requiring attention")
         
@@ -838,27 +1094,60 @@ class IntelligentNotificationSystem:
         return "\n".join([f"• {insight}" for insight in insights])
     
     def _load_notification_history(self):
-        """Load notification history from storage"""
+        """Load notification history from storage and open it for appending"""
         try:
-            history_file = self.storage_path / 'history.json'
-            if history_file.exists():
-                with open(history_file, 'r') as f:
-                    history_data = json.load(f)
-                    # Convert back to SmartNotification objects
-                    self.notification_history = [
-                        SmartNotification(**item) for item in history_data
-                    ]
+            history_file = self.storage_path / 'history.jsonl'
+            lines = history_file.read_bytes().splitlines() if history_file.exists() else []
+            
+            for line in lines[-self.HISTORY_SIZE:]:
+                try:
+                    item = _json_loads(line)
+                    item['priority'] = NotificationPriority(item['priority'])
+                    item['notification_type'] = NotificationType(item['notification_type'])
+                    self.notification_history.append(SmartNotification(**item))
+                except Exception:
+                    continue  # e.g. a record cut short by a crash
+            
+            if len(lines) >= self.HISTORY_COMPACT_SIZE:
+                # Rewrite with only the records still kept in memory
+                tmp_file = history_file.with_suffix('.jsonl.tmp')
+                tmp_file.write_bytes(b''.join(
+                    self._history_line(notification) for notification in self.notification_history))
+                os.replace(tmp_file, history_file)
+            
+            self._history_file = open(history_file, 'ab')
+            atexit.register(self._save_notification_history)
         except Exception as e:
             print(f"Failed to load notification history: {e}")
     
+    @staticmethod
+    def _history_line(notification: SmartNotification) -> bytes:
+        """history.jsonl line for a notification, with enums stored by value"""
+        if HAVE_ORJSON:
+            # orjson encodes dataclasses and enums natively, in C
+            return orjson.dumps(notification) + b'\n'
+        
+        # Shallow copy of the fields; asdict() would deep-copy context/actions
+        record = dict(vars(notification))
+        record['priority'] = notification.priority.value
+        record['notification_type'] = notification.notification_type.value
+        return json.dumps(record, separators=(',', ':')).encode('utf-8') + b'\n'
+    
+    def _record_notification_history(self, notification: SmartNotification):
+        """Add a dismissed notification to the history, appending it to history.jsonl"""
+        self.notification_history.append(notification)
+        if self._history_file is not None:
+            try:
+                # Buffered; written out by _save_notification_history
+                self._history_file.write(self._history_line(notification))
+            except Exception as e:
+                print(f"Failed to record notification history: {e}")
+    
     def _save_notification_history(self):
-        """Save notification history to storage"""
+        """Flush history records appended since the last save"""
         try:
-            history_file = self.storage_path / 'history.json'
-            with open(history_file, 'w') as f:
-                # Convert SmartNotification objects to dict
-                history_data = [asdict(notification) for notification in self.notification_history[-100:]]  # Keep last 100
-                json.dump(history_data, f, indent=2)
+            if self._history_file is not None:
+                self._history_file.flush()
         except Exception as e:
             print(f"Failed to save notification history: {e}")
     